@@ -0,0 +1,162 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# Measures the time depgen takes to assemble long logical lines: Fortran
+# statements with many continuation lines, long block comments and macro
+# definitions with many backslash-continued lines. Each input is processed
+# with its logical lines of the given length and twice as long, and the time
+# of processing an input without them (i.e. the startup time) is subtracted:
+# the ratio of the times is about 2 if the assembly is linear in the length of
+# the logical lines (and about 4 if it is quadratic). Usage:
+#   line_assembly.py [-n RUNS] [DEPGEN]
+# DEPGEN is the depgen.py script to measure (default: the one of this
+# repository); the one of another checkout (e.g. created with
+# `git worktree add`) gives the numbers for another revision.
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def gen_statements(f, count, length):
+    # Fortran statements of LENGTH continuation lines:
+    for i in range(count):
+        f.write("  call sub{0}(a0, &\n".format(i))
+        for j in range(1, length - 1):
+            f.write("    & a{0}, &\n".format(j))
+        f.write("    & a{0})\n".format(length - 1))
+
+
+def gen_comments(f, count, length):
+    # Block comments of LENGTH lines:
+    for i in range(count):
+        f.write("/* Comment {0}\n".format(i))
+        for j in range(1, length - 1):
+            f.write(" * line {0} of the license header\n".format(j))
+        f.write(" */\n  x = {0}\n".format(i))
+
+
+def gen_macros(f, count, length):
+    # Macro definitions of LENGTH backslash-continued lines:
+    for i in range(count):
+        f.write("#define MACRO{0} \\\n".format(i))
+        for j in range(1, length - 1):
+            f.write("  a{0} + \\\n".format(j))
+        f.write("  0\n")
+
+
+# Shapes of the inputs: descriptions, generators, options of depgen, numbers
+# and lengths of the logical lines:
+_SHAPES = [
+    (
+        "Fortran statements (continuation lines)",
+        gen_statements,
+        ["--fc-enable"],
+        200,
+        255,
+    ),
+    ("block comments (lines)", gen_comments, ["--pp-enable"], 20, 5000),
+    ("macros (continuation lines)", gen_macros, ["--pp-enable"], 20, 2000),
+]
+
+
+def measure(cmd, runs):
+    with open(os.devnull, "w") as devnull:
+        result = []
+        for _ in range(runs):
+            start = _timer()
+            subprocess.check_call(cmd, stdout=devnull)
+            result.append(_timer() - start)
+    return min(result)
+
+
+def main():
+    argv = sys.argv[1:]
+    runs = 3
+    if len(argv) > 1 and argv[0] == "-n":
+        runs = int(argv[1])
+        argv = argv[2:]
+    depgen = (
+        argv[0] if argv else os.path.join(_root_dir, "mkhelper", "depgen.py")
+    )
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        src_file = os.path.join(tmp_dir, "input.f90")
+        for description, gen, options, count, length in _SHAPES:
+            cmd = [sys.executable, depgen] + options
+            cmd += ["-i", src_file, "-o", os.path.join(tmp_dir, "input.d")]
+            times = []
+            for n in (0, length, 2 * length):
+                with open(src_file, "w") as f:
+                    f.write("module m\n")
+                    gen(f, count if n else 0, n)
+                    f.write("end module m\n")
+                times.append(measure(cmd, runs))
+            times = [t - times[0] for t in times[1:]]
+            sys.stdout.write(
+                "{0} x {1} {2}: {3:.3f} s, x {4}: {5:.3f} s, ratio "
+                "{6:.2f}\n".format(
+                    count,
+                    length,
+                    description,
+                    times[0],
+                    2 * length,
+                    times[1],
+                    times[1] / times[0],
+                )
+            )
+    finally:
+        for f in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, f))
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# Checks that the time depgen takes to recognize the Fortran procedures with
+# the 'module' prefix grows linearly with the length of the lines: the lines
+# of the pathological shapes (see test_inputs/module_prefixes.f90) are scaled
+# and the program fails if the time (without the startup time) of the longest
+# lines exceeds the time of the shortest ones by more than MAX_RATIO times the
+# ratio of their lengths or if processing of an input takes longer than TIMEOUT
+# seconds. Usage:
+#   module_prefixes.py [-n RUNS] [DEPGEN]
+# DEPGEN is the depgen.py script to check (default: the one of this
+# repository).
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MAX_RATIO = 2.0
+_TIMEOUT = 10.0
+
+# The times that are too short to be compared reliably (in seconds):
+_MIN_TIME = 0.05
+
+# Numbers of the repeated elements of the lines:
+_SIZES = [10000, 20000, 40000, 80000]
+
+
+def gen_attributes(n):
+    # Words with parenthesized specifications around 'module':
+    attrs = " ".join("attr{0}(kind=k{0})".format(i) for i in range(n))
+    return "  {0} module {0} integer\n".format(attrs)
+
+
+def gen_words(n):
+    # Plain words around 'module':
+    words = " ".join("w{0}".format(i) for i in range(n))
+    return "  {0} module {0} x\n".format(words)
+
+
+def gen_nested(n):
+    # Deeply nested parentheses before 'module function':
+    return "  {0}{1} module function f()\n".format("real(" * n, ")" * n)
+
+
+_SHAPES = [
+    ("parenthesized attributes", gen_attributes),
+    ("plain words", gen_words),
+    ("nested parentheses", gen_nested),
+]
+
+
+def measure(cmd, runs):
+    # Returns the shortest running time of the command CMD or None if it
+    # takes longer than _TIMEOUT:
+    with open(os.devnull, "w") as devnull:
+        result = []
+        for _ in range(runs):
+            start = _timer()
+            p = subprocess.Popen(cmd, stdout=devnull)
+            while p.poll() is None:
+                if _timer() - start > _TIMEOUT:
+                    p.kill()
+                    p.wait()
+                    return None
+                time.sleep(0.001)
+            if p.returncode:
+                raise subprocess.CalledProcessError(p.returncode, cmd)
+            result.append(_timer() - start)
+    return min(result)
+
+
+def main():
+    argv = sys.argv[1:]
+    runs = 3
+    if len(argv) > 1 and argv[0] == "-n":
+        runs = int(argv[1])
+        argv = argv[2:]
+    depgen = (
+        argv[0] if argv else os.path.join(_root_dir, "mkhelper", "depgen.py")
+    )
+
+    failed = False
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        src_file = os.path.join(tmp_dir, "input.f90")
+        cmd = [
+            sys.executable,
+            depgen,
+            "--fc-enable",
+            "-i",
+            src_file,
+            "-o",
+            os.path.join(tmp_dir, "input.d"),
+        ]
+
+        def run(line):
+            with open(src_file, "w") as f:
+                f.write("module m\n")
+                f.write(line)
+                f.write("end module m\n")
+            return measure(cmd, runs)
+
+        startup_time = run("")
+        for description, gen in _SHAPES:
+            times = []
+            for n in _SIZES:
+                t = run(gen(n))
+                if t is None:
+                    sys.stdout.write(
+                        "FAILED: {0} ({1}): timeout ({2} s)\n".format(
+                            description, n, _TIMEOUT
+                        )
+                    )
+                    failed = True
+                    break
+                times.append(max(t - startup_time, 0.0))
+            else:
+                sys.stdout.write(
+                    "{0}: {1}\n".format(
+                        description,
+                        ", ".join(
+                            "{0}: {1:.3f} s".format(n, t)
+                            for n, t in zip(_SIZES, times)
+                        ),
+                    )
+                )
+                limit = _MAX_RATIO * _SIZES[-1] / _SIZES[0]
+                if times[-1] > _MIN_TIME and times[-1] > limit * max(
+                    times[0], _MIN_TIME
+                ):
+                    sys.stdout.write(
+                        "FAILED: {0}: the time grows faster than "
+                        "linearly ({1} -> {2})\n".format(
+                            description, _SIZES[0], _SIZES[-1]
+                        )
+                    )
+                    failed = True
+    finally:
+        for f in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, f))
+        os.rmdir(tmp_dir)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
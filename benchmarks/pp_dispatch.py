@@ -0,0 +1,145 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# Measures the per-line cost of the preprocessing stage of depgen on large
+# Fortran sources, in which most of the lines are not directives. The cost is
+# the difference of the running times for two sizes of the input divided by
+# the difference of their lengths, which excludes the startup time. Usage:
+#   pp_dispatch.py [-n RUNS] [-l LINES] [DEPGEN]
+# DEPGEN is the depgen.py script to measure (default: the one of this
+# repository); the one of another checkout (e.g. created with
+# `git worktree add`) gives the numbers for another revision.
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Number of lines per directive:
+_DIRECTIVE_PERIODS = [100, 10]
+
+
+def gen_input(filename, lines, period):
+    # Writes a module with LINES lines, every PERIOD-th of which is a
+    # directive:
+    with open(filename, "w") as f:
+        f.write("module m\n")
+        for i in range(lines):
+            if i % period:
+                f.write("  x{0} = y{0} * 2 + z ! comment\n".format(i))
+            else:
+                f.write(
+                    (
+                        "#ifdef FLAG{0}",
+                        "#define MACRO{0} {0}",
+                        "#else",
+                        "#endif",
+                    )[(i // period) % 4].format(i)
+                    + "\n"
+                )
+        f.write("end module m\n")
+
+
+def measure(cmd, runs):
+    with open(os.devnull, "w") as devnull:
+        result = []
+        for _ in range(runs):
+            start = _timer()
+            subprocess.check_call(cmd, stdout=devnull)
+            result.append(_timer() - start)
+    return min(result)
+
+
+def main():
+    argv = sys.argv[1:]
+    runs, lines = 5, 60000
+    while len(argv) > 1 and argv[0] in ("-n", "-l"):
+        if argv[0] == "-n":
+            runs = int(argv[1])
+        else:
+            lines = int(argv[1])
+        argv = argv[2:]
+    depgen = (
+        argv[0] if argv else os.path.join(_root_dir, "mkhelper", "depgen.py")
+    )
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        src_file = os.path.join(tmp_dir, "input.f90")
+        cmd = [
+            sys.executable,
+            depgen,
+            "--pp-enable",
+            "--pp-eval-expr",
+            "-i",
+            src_file,
+            "-o",
+            os.path.join(tmp_dir, "input.d"),
+        ]
+        for period in _DIRECTIVE_PERIODS:
+            times = []
+            for n in (lines, 2 * lines):
+                gen_input(src_file, n, period)
+                times.append(measure(cmd, runs))
+            sys.stdout.write(
+                "1 directive per {0:>3} lines: {1:6.2f} us per line "
+                "({2:.3f} s for {3} lines)\n".format(
+                    period,
+                    1e6 * (times[1] - times[0]) / lines,
+                    times[1],
+                    2 * lines,
+                )
+            )
+    finally:
+        for f in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, f))
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# Checks that the single-pass engine of depgen (see --single-pass) gives the
+# same results as the chain of the parsers stacked as generators and compares
+# their running times. The results are compared for each file of test_inputs
+# (with the arguments specified in the file), with and without the debug
+# output. The running times are measured for a large Fortran source with
+# directives processed by all stages. The program fails if the results
+# differ. Usage:
+#   single_pass.py [-n RUNS] [-l LINES] [DEPGEN]
+# DEPGEN is the depgen.py script to check (default: the one of this
+# repository).
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_test_dir = os.path.join(_root_dir, "test_inputs")
+
+
+def read_args(filename):
+    # Returns the list of arguments specified in the test input FILENAME:
+    with open(filename, "r") as f:
+        for line in f:
+            if line.startswith("! args:"):
+                return line[len("! args:") :].split()
+    return None
+
+
+def read_results(dep_file):
+    # Returns the contents of the dependency file DEP_FILE and of its debug
+    # log without the lines that mention the engine (i.e. the command and the
+    # value of the argument):
+    result = []
+    for filename in (dep_file, dep_file + ".log"):
+        if os.path.exists(filename):
+            with open(filename, "r") as f:
+                lines = []
+                for line in f:
+                    if line.startswith("# Command:"):
+                        next(f, None)
+                    elif not line.startswith("#  single_pass="):
+                        lines.append(line)
+                result.append(lines)
+            os.remove(filename)
+        else:
+            result.append(None)
+    return result
+
+
+def gen_input(filename, lines):
+    # Writes a module with LINES lines, some of which are directives:
+    with open(filename, "w") as f:
+        f.write("module m\n")
+        for i in range(lines):
+            if i % 50:
+                f.write(
+                    "  x{0} = y{0} * f({0}) + g('str') ! comment\n".format(i)
+                )
+            else:
+                f.write("#ifdef FLAG{0}\n  use m{0}\n#endif\n".format(i))
+        f.write("end module m\n")
+
+
+def measure(cmd, runs):
+    with open(os.devnull, "w") as devnull:
+        result = []
+        for _ in range(runs):
+            start = _timer()
+            subprocess.check_call(cmd, stdout=devnull)
+            result.append(_timer() - start)
+    return min(result)
+
+
+def main():
+    argv = sys.argv[1:]
+    runs, lines = 5, 60000
+    while len(argv) > 1 and argv[0] in ("-n", "-l"):
+        if argv[0] == "-n":
+            runs = int(argv[1])
+        else:
+            lines = int(argv[1])
+        argv = argv[2:]
+    depgen = (
+        argv[0] if argv else os.path.join(_root_dir, "mkhelper", "depgen.py")
+    )
+
+    failed = False
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        dep_file = os.path.join(tmp_dir, "input.d")
+        for test_input in sorted(os.listdir(_test_dir)):
+            args = read_args(os.path.join(_test_dir, test_input))
+            if args is None:
+                continue
+            for debug in ([], ["--debug=deps"], ["--debug=all"]):
+                results = []
+                for engine in ([], ["--single-pass"]):
+                    subprocess.check_call(
+                        [sys.executable, depgen]
+                        + args
+                        + debug
+                        + engine
+                        + ["-o", dep_file],
+                        cwd=_test_dir,
+                    )
+                    results.append(read_results(dep_file))
+                if results[0] != results[1]:
+                    sys.stdout.write(
+                        "FAILED: {0}{1}: the results differ\n".format(
+                            test_input, " " + debug[0] if debug else ""
+                        )
+                    )
+                    failed = True
+
+        src_file = os.path.join(tmp_dir, "input.f90")
+        gen_input(src_file, lines)
+        cmd = [
+            sys.executable,
+            depgen,
+            "--pp-enable",
+            "--lc-enable",
+            "--fc-enable",
+            "-i",
+            src_file,
+            "-o",
+            dep_file,
+        ]
+        for description, engine in (
+            ("chained parsers", []),
+            ("single pass", ["--single-pass"]),
+        ):
+            sys.stdout.write(
+                "{0:<16} {1:.3f} s for {2} lines\n".format(
+                    description, measure(cmd + engine, runs), lines
+                )
+            )
+    finally:
+        for f in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, f))
+        os.rmdir(tmp_dir)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# Measures the wall time from fork to exit of the mkhelper tools, i.e. the
+# time that is dominated by the startup of the interpreter and the tool for
+# the typical (small) inputs. Usage:
+#   startup.py [-n RUNS] [PYTHON]
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+_timer = getattr(time, "perf_counter", time.time)
+
+_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_mkhelper_dir = os.path.join(_root_dir, "mkhelper")
+
+
+def measure(cmd, runs):
+    with open(os.devnull, "w") as devnull:
+        # The first run compiles and caches the bytecode of the modules:
+        subprocess.call(cmd, stdout=devnull, stderr=devnull)
+        result = []
+        for _ in range(runs):
+            start = _timer()
+            subprocess.call(cmd, stdout=devnull, stderr=devnull)
+            result.append(_timer() - start)
+    result.sort()
+    return result
+
+
+def main():
+    argv = sys.argv[1:]
+    runs = 20
+    if len(argv) > 1 and argv[0] == "-n":
+        runs = int(argv[1])
+        argv = argv[2:]
+    python = argv[0] if argv else sys.executable
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        dep_file = os.path.join(tmp_dir, "main.f90.d")
+        depgen_cmd = [
+            python,
+            os.path.join(_mkhelper_dir, "depgen.py"),
+            "--pp-enable",
+            "--pp-eval-expr",
+            "--pp-inc-sys",
+            "--fc-enable",
+            "--fc-mod-ext=mod.proxy",
+            "-i",
+            os.path.join(_root_dir, "src", "program", "main.f90"),
+            "-o",
+            dep_file,
+            "--",
+            "-I" + os.path.join(_root_dir, "src", "include"),
+        ]
+        commands = [
+            ("python", [python, "-c", "pass"]),
+            ("depgen", depgen_cmd),
+            (
+                "deplist",
+                [
+                    python,
+                    os.path.join(_mkhelper_dir, "deplist.py"),
+                    "-t",
+                    "main.o",
+                    "-f",
+                    dep_file,
+                ],
+            ),
+            (
+                "fortmodcmp",
+                [
+                    python,
+                    os.path.join(_mkhelper_dir, "fortmodcmp.py"),
+                    dep_file,
+                    dep_file,
+                ],
+            ),
+        ]
+        for name, cmd in commands:
+            times = measure(cmd, runs)
+            sys.stdout.write(
+                "{0:<12}min {1:7.1f} ms  median {2:7.1f} ms\n".format(
+                    name, 1000 * times[0], 1000 * times[len(times) // 2]
+                )
+            )
+    finally:
+        for f in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, f))
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
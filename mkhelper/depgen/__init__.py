@@ -37,6 +37,12 @@ except ImportError:
     # noinspection PyUnresolvedReferences
     from itertools import izip_longest as zip_longest23  # noqa: F401
 
+# Levels of the debug information reported by the parsers: the events that
+# explain the dependencies (e.g. an included file or a used module) and all
+# events (e.g. evaluated conditions):
+DEBUG_DEPS = 1
+DEBUG_ALL = 2
+
 
 def open23(name, mode="r"):
     if sys.version_info < (3, 0, 0):
@@ -51,6 +57,35 @@ def open23(name, mode="r"):
         )
 
 
+def stream23(data):
+    """
+    Returns a stream of the lines of DATA (bytes), which are decoded the same
+    way as the lines of a file opened with open23 in the text mode.
+    """
+    import io
+
+    if sys.version_info < (3, 0, 0):
+        return io.BytesIO(data)
+    else:
+        return io.TextIOWrapper(
+            io.BytesIO(data), encoding="UTF-8", errors="surrogateescape"
+        )
+
+
+def encode23(string):
+    if sys.version_info < (3, 0, 0):
+        return string
+    else:
+        return string.encode("UTF-8", "surrogateescape")
+
+
+def decode23(data):
+    if sys.version_info < (3, 0, 0):
+        return data
+    else:
+        return data.decode("UTF-8", "surrogateescape")
+
+
 def map23(foo, iterable):
     if sys.version_info < (3, 0, 0):
         return map(foo, iterable)
@@ -72,6 +107,23 @@ else:
             pass
 
 
+def file_stat(f):
+    # Returns a list of the modification time and the size of the file F or
+    # None if the file is not accessible:
+    try:
+        st = os.stat(f)
+        return [st.st_mtime, st.st_size]
+    except OSError:
+        return None
+
+
+def probes_changed(probes):
+    # Checks whether the result of any of the PROBES, which are lists of the
+    # arguments and the results of DirectoryIndex.isfile, would be different
+    # now:
+    return any(os.path.isfile(os.path.join(d, f)) != r for d, f, r in probes)
+
+
 def file_in_dir(f, d):
     if d:
         return os.path.abspath(f).startswith(os.path.abspath(d) + os.path.sep)
@@ -79,61 +131,107 @@ def file_in_dir(f, d):
         return True
 
 
-def find_unquoted_string(string, line, quotes="'\""):
-    skip = 0
-    quote = None
-    while 1:
-        idx = line.find(string, skip)
-        if idx < 0:
-            return idx
-
-        escaped = False
-        for c in line[skip:idx]:
-            if escaped:
-                escaped = False
-            elif c in quotes:
-                if quote is None:
-                    quote = c
-                elif quote == c:
-                    quote = None
-            elif c == "\\" and quote:
-                escaped = True
-
-        if quote:
-            skip = idx + len(string)
+def unquoted_lexer(strings, quotes="'\""):
+    """
+    Returns a compiled regular expression that, when applied with finditer(),
+    scans a line in a single pass and matches either a (possibly unterminated)
+    string literal delimited with one of the QUOTES or one of the STRINGS. The
+    occurrences of the STRINGS outside the literals are captured in the first
+    group, i.e. the group is None for the literals. A backslash inside a literal
+    escapes the next character.
+    """
+    import re
+
+    literals = [
+        r"{0}(?:[^{0}\\]|\\.)*{0}?".format(re.escape(q)) for q in quotes
+    ]
+    targets = "({0})".format("|".join(re.escape(s) for s in strings))
+    return re.compile("|".join(literals + [targets]), re.S)
+
+
+class DirectoryIndex(object):
+    __slots__ = ["_listings", "probes"]
+
+    def __init__(self):
+        # Dictionary of directory listings: each directory is listed only once
+        # and the following checks are answered from memory, which saves
+        # metadata requests on parallel filesystems:
+        self._listings = dict()
+
+        # If not None, the dictionary of the results of the checks (the keys
+        # are tuples of the arguments of isfile), which includes the negative
+        # ones: a file that is created later might change the results of the
+        # include searches:
+        self.probes = None
+
+    def isfile(self, directory, filename):
+        if os.path.dirname(filename):
+            # Do not index subdirectories:
+            result = os.path.isfile(os.path.join(directory, filename))
         else:
-            return idx
+            listing = self._listings.get(directory, None)
+            if listing is None:
+                listing = self._list(directory)
+                self._listings[directory] = listing
+
+            files, verify = listing
+            result = filename in files and (
+                not verify or os.path.isfile(os.path.join(directory, filename))
+            )
+
+        if self.probes is not None:
+            self.probes[(directory, filename)] = result
+        return result
+
+    def clear(self):
+        self._listings.clear()
+
+    @staticmethod
+    def _list(directory):
+        # Returns a set of names and a flag telling whether the names might
+        # refer to something that is not a file:
+        try:
+            if hasattr(os, "scandir"):
+                return (
+                    frozenset(
+                        entry.name
+                        for entry in os.scandir(directory or ".")
+                        if entry.is_file()
+                    ),
+                    False,
+                )
+            else:
+                return frozenset(os.listdir(directory or ".")), True
+        except OSError:
+            return frozenset(), False
 
 
 class IncludeFinder:
-    def __init__(self, include_order=None, include_dirs=None):
+    def __init__(self, include_order=None, include_dirs=None, dir_index=None):
         self.include_order = include_order
         self.include_dirs = include_dirs
+        self.dir_index = dir_index if dir_index else DirectoryIndex()
 
     def find(self, filename, root_includer=None, current_includer=None):
-        if os.path.isabs(filename) and os.path.isfile(filename):
+        if os.path.isabs(filename) and self.dir_index.isfile("", filename):
             return filename
         elif self.include_order:
+            isfile = self.dir_index.isfile
             for inc_type in self.include_order:
-                if inc_type == "cwd" and os.path.isfile(filename):
+                if inc_type == "cwd" and isfile("", filename):
                     return filename
                 elif inc_type == "src" and root_includer:
-                    candidate = os.path.join(
-                        os.path.dirname(root_includer), filename
-                    )
-                    if os.path.isfile(candidate):
-                        return candidate
+                    d = os.path.dirname(root_includer)
+                    if isfile(d, filename):
+                        return os.path.join(d, filename)
                 elif inc_type == "inc" and current_includer:
-                    candidate = os.path.join(
-                        os.path.dirname(current_includer), filename
-                    )
-                    if os.path.isfile(candidate):
-                        return candidate
+                    d = os.path.dirname(current_includer)
+                    if isfile(d, filename):
+                        return os.path.join(d, filename)
                 elif inc_type == "flg" and self.include_dirs:
                     for d in self.include_dirs:
-                        candidate = os.path.join(d, filename)
-                        if os.path.isfile(candidate):
-                            return candidate
+                        if isfile(d, filename):
+                            return os.path.join(d, filename)
         return None
 
 
@@ -155,6 +253,9 @@ class StreamStack(object):
     def current_name(self):
         return self._name_stack[-1] if self._name_stack else None
 
+    def __len__(self):
+        return len(self._stream_stack)
+
     def push(self, stream, name=None, close=True):
         self._stream_stack.append(stream)
         self._close_stack.append(close)
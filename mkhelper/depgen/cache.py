@@ -0,0 +1,248 @@
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import hashlib
+import os
+
+from depgen import encode23, file_stat, probes_changed
+
+# Increment when the format of the entries changes:
+_FORMAT_VERSION = 2
+
+
+def data_digest(data):
+    """
+    Returns the hexadecimal SHA-1 digest of DATA (bytes), which is equal to
+    the digest of a file with the contents DATA (see file_digest).
+    """
+    return hashlib.sha1(data).hexdigest()
+
+
+def file_digest(filename):
+    """
+    Returns the hexadecimal SHA-1 digest of the contents of FILENAME.
+    """
+    h = hashlib.sha1()
+    with open(filename, "rb") as f:
+        while 1:
+            buf = f.read(65536)
+            if not buf:
+                return h.hexdigest()
+            h.update(buf)
+
+
+def _settings_digest(settings):
+    # Modules that are needed only for the persistent storage are imported
+    # on demand, which saves time at the startup of the program:
+    import glob
+
+    h = hashlib.sha1()
+    h.update(str(_FORMAT_VERSION).encode("ascii"))
+    h.update(encode23(settings))
+    # Invalidate the cache when the parsers are updated:
+    for f in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+        h.update(file_digest(f).encode("ascii"))
+    return h.hexdigest()
+
+
+def _read_entry(entry_name):
+    import json
+
+    with open(entry_name, "r") as f:
+        return json.load(f)
+
+
+def _get_umask():
+    # The umask can only be read by setting it:
+    result = os.umask(0)
+    os.umask(result)
+    return result
+
+
+def _write_entry(entry_name, entry):
+    import json
+    import tempfile
+
+    entry_dir = os.path.dirname(entry_name)
+    try:
+        os.makedirs(entry_dir)
+    except OSError:
+        if not os.path.isdir(entry_dir):
+            raise
+
+    fd, tmp_name = tempfile.mkstemp(dir=entry_dir, prefix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        # The temporary file is created with mode 0600 but the entries must
+        # be readable by the other users of a shared cache directory:
+        os.chmod(tmp_name, 0o666 & ~_get_umask())
+        os.rename(tmp_name, entry_name)
+    except BaseException:
+        os.remove(tmp_name)
+        raise
+
+
+class ResultCache(object):
+    """
+    Content-addressed storage of the parsing results. The key of an entry is
+    the hash of the content of the input file, its name, the settings of the
+    parser chain (SETTINGS) and the source code of the parsers. Each entry
+    stores the digests of all files included by the input, which must match
+    their current contents for the entry to be used, and the results of the
+    checks for the existence of files made by the include searches, which
+    must not change (e.g. when a header is created in a directory that is
+    searched before the one with the header found). The entries are written
+    atomically, therefore, the cache directory can be shared by several
+    processes (e.g. running in different build directories).
+    """
+
+    __slots__ = ["_cache_dir", "_settings_digest"]
+
+    def __init__(self, cache_dir, settings):
+        self._cache_dir = cache_dir
+        self._settings_digest = _settings_digest(settings)
+
+    def get(self, input_name, input_digest):
+        """
+        Returns the parsing results for INPUT_NAME with the contents of the
+        digest INPUT_DIGEST (see file_digest) stored with put() or None if the
+        cache does not contain a valid entry for the file.
+        """
+        entry_name = self._entry_name(input_name, input_digest)
+        try:
+            entry = _read_entry(entry_name)
+            for filename, digest in entry["included"]:
+                if file_digest(filename) != digest:
+                    return None
+            for filename in entry["lc"]:
+                if not os.path.isfile(filename):
+                    return None
+            if probes_changed(entry["probes"]):
+                return None
+        except (EnvironmentError, ValueError, KeyError):
+            return None
+        return entry["results"]
+
+    def put(
+        self, input_name, input_digest, results, included_files, lc_files, probes
+    ):
+        """
+        Stores the parsing RESULTS for INPUT_NAME with the contents of the
+        digest INPUT_DIGEST. The entry is valid as long as the contents of
+        INCLUDED_FILES do not change, LC_FILES exist, and the PROBES (see
+        probes_changed) give the same results.
+        """
+        _write_entry(
+            self._entry_name(input_name, input_digest),
+            {
+                "included": [[f, file_digest(f)] for f in included_files],
+                "lc": list(lc_files),
+                "probes": probes,
+                "results": results,
+            },
+        )
+
+    def _entry_name(self, input_name, input_digest):
+        h = hashlib.sha1()
+        h.update(self._settings_digest.encode("ascii"))
+        h.update(encode23(input_name))
+        h.update(input_digest.encode("ascii"))
+        digest = h.hexdigest()
+        return os.path.join(self._cache_dir, digest[:2], digest[2:])
+
+
+class HeaderCache(object):
+    """
+    Storage of the summaries of the preprocessed headers. The key of a summary
+    is the path to the header, its modification time and size, and the digest
+    of the macro definitions at the point of the inclusion (MACRO_DIGEST). The
+    summaries are kept in memory and, if CACHE_DIR is not None, in the cache
+    directory, where the keys are extended with the digest of the settings of
+    the parser chain (SETTINGS) and the source code of the parsers.
+    """
+
+    __slots__ = ["_cache_dir", "_settings_digest", "_summaries"]
+
+    def __init__(self, cache_dir=None, settings=""):
+        self._cache_dir = cache_dir
+        self._settings_digest = (
+            _settings_digest(settings) if cache_dir else None
+        )
+        self._summaries = {}
+
+    def get(self, filename, macro_digest):
+        """
+        Returns the summary of the header FILENAME stored with put() or None
+        if the cache does not contain a summary for the current state of the
+        file and MACRO_DIGEST.
+        """
+        key = self._key(filename, file_stat(filename), macro_digest)
+        if key is None:
+            return None
+
+        summary = self._summaries.get(key, None)
+        if summary is None and self._cache_dir:
+            try:
+                summary = _read_entry(self._entry_name(key))
+            except (EnvironmentError, ValueError):
+                return None
+            self._summaries[key] = summary
+        return summary
+
+    def put(self, filename, stat, macro_digest, summary):
+        """
+        Stores the SUMMARY of the header FILENAME, which had the modification
+        time and size STAT at the time of reading.
+        """
+        key = self._key(filename, stat, macro_digest)
+        if key is None:
+            return
+
+        self._summaries[key] = summary
+        if self._cache_dir:
+            try:
+                _write_entry(self._entry_name(key), summary)
+            except (EnvironmentError, TypeError, ValueError):
+                # The cache directory is not writable or the summary cannot
+                # be serialized: keep the summary in memory only.
+                pass
+
+    @staticmethod
+    def _key(filename, stat, macro_digest):
+        return (filename, stat[0], stat[1], macro_digest) if stat else None
+
+    def _entry_name(self, key):
+        h = hashlib.sha1()
+        h.update(self._settings_digest.encode("ascii"))
+        h.update(encode23(os.path.abspath(key[0])))
+        h.update(encode23(repr(key[1:])))
+        digest = h.hexdigest()
+        return os.path.join(self._cache_dir, "headers", digest[:2], digest[2:])
@@ -0,0 +1,220 @@
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import hashlib
+
+from depgen import encode23, open23, stream23
+
+# Prefix of the lines that precede the rules of each input file; the prefix
+# is followed by the SHA-1 digest of the contents of the file and by its name
+# (the modification time is not used, so that a file that is touched but not
+# changed does not change the output):
+_ENTRY_MARKER = "#@ "
+# Prefix of the names of the variables that hold the shared prerequisite
+# lists:
+_VAR_PREFIX = "depmerge_"
+# Minimal length of a prerequisite list to be shared:
+_SHARE_MIN_LENGTH = 32
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        fromfile_prefix_chars="@",
+        description="Merges a set of dependency makefiles (e.g. generated with "
+        "depgen.py) into a single makefile, which is faster to read by make "
+        "than a large number of small files. The rules of the INPUT files "
+        "the contents of which have not changed since the previous run are "
+        "taken from the existing OUTPUT, and the prerequisite lists that "
+        "appear more than once are defined as variables.",
+    )
+
+    parser.add_argument(
+        "--input",
+        "-i",
+        metavar="INPUT",
+        nargs="*",
+        default=[],
+        help="input dependency makefiles; missing files are ignored",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="OUTPUT",
+        required=True,
+        help="output makefile, which is not rewritten (and, therefore, keeps "
+        "its modification time) if its contents would not change",
+    )
+
+    return parser.parse_args()
+
+
+def read_output(text):
+    """
+    Parses the TEXT of the OUTPUT generated by a previous run and returns a
+    dictionary that maps the names of the input files to tuples of the
+    digests of their contents and the lists of their lines with the
+    references to the shared variables expanded.
+    """
+    entries = {}
+    variables = {}
+    lines = None
+    for line in text.splitlines():
+        if line.startswith(_ENTRY_MARKER):
+            digest, _, name = line[len(_ENTRY_MARKER) :].partition(" ")
+            lines = []
+            entries[name] = (digest, lines)
+        elif lines is not None:
+            rule = _split_rule(line)
+            if rule:
+                targets, prereqs, comment = rule
+                value = variables.get(prereqs, None)
+                if value is not None:
+                    line = _join_rule(targets, value, comment)
+            lines.append(line)
+        elif line.startswith(_VAR_PREFIX):
+            name, _, value = line.partition(":= ")
+            variables["$({0})".format(name)] = value
+    return entries
+
+
+def read_input(data):
+    """
+    Parses the contents DATA (bytes) of a dependency makefile and returns the
+    list of its lines without comments and empty lines.
+    """
+    result = []
+    continued = False
+    for line in stream23(data):
+        line = line.rstrip("\n")
+        if continued or (line and not line.startswith("#")):
+            result.append(line)
+        continued = line.endswith("\\")
+    return result
+
+
+def gen_output(names, entries):
+    # Count the prerequisite lists that can be shared:
+    counts = {}
+    for name in names:
+        for line in entries[name][1]:
+            rule = _split_rule(line)
+            if rule and _is_shareable(rule[1]):
+                counts[rule[1]] = counts.get(rule[1], 0) + 1
+
+    # The names of the variables depend only on their values, which keeps the
+    # output stable when the set of the inputs changes:
+    variables = {}
+    values = {}
+    for prereqs, count in counts.items():
+        if count > 1:
+            digest = hashlib.sha1(encode23(prereqs)).hexdigest()
+            var = _VAR_PREFIX + digest[:12]
+            if var not in values:
+                values[var] = prereqs
+                variables[prereqs] = var
+
+    result = [
+        "# Generated by depmerge.py: the rules of each input file follow "
+        "its '{0}' line.\n".format(_ENTRY_MARKER.strip())
+    ]
+    result.extend(
+        "{0}:= {1}\n".format(var, values[var]) for var in sorted(values)
+    )
+    for name in names:
+        digest, lines = entries[name]
+        result.append("{0}{1} {2}\n".format(_ENTRY_MARKER, digest, name))
+        for line in lines:
+            rule = _split_rule(line)
+            if rule:
+                targets, prereqs, comment = rule
+                var = variables.get(prereqs, None)
+                if var is not None:
+                    line = _join_rule(targets, "$({0})".format(var), comment)
+            result.append(line + "\n")
+    return "".join(result)
+
+
+def main():
+    args = parse_args()
+
+    try:
+        with open23(args.output, "r") as f:
+            old_output = f.read()
+    except EnvironmentError:
+        old_output = ""
+
+    old_entries = read_output(old_output)
+
+    names = []
+    entries = {}
+    for name in args.input:
+        if name in entries:
+            continue
+        try:
+            with open(name, "rb") as f:
+                data = f.read()
+        except EnvironmentError:
+            continue
+        names.append(name)
+        digest = hashlib.sha1(data).hexdigest()
+        entry = old_entries.get(name, None)
+        if entry is None or entry[0] != digest:
+            # The file is new or has changed since the previous run:
+            entry = digest, read_input(data)
+        entries[name] = entry
+
+    output = gen_output(names, entries)
+    if output != old_output:
+        with open23(args.output, "w") as f:
+            f.write(output)
+
+
+def _split_rule(line):
+    # Returns a tuple of the targets, the prerequisites and the comment of the
+    # single-line rule LINE or None if LINE is not such a rule:
+    if not line or line[0] in "\t#" or "=" in line or line.endswith("\\"):
+        return None
+    targets, colon, rest = line.partition(":")
+    if not colon or rest.startswith(":"):
+        return None
+    prereqs, _, comment = rest.partition("#")
+    return targets.rstrip(), prereqs.strip(), comment
+
+
+def _join_rule(targets, prereqs, comment):
+    result = "{0}: {1}".format(targets, prereqs)
+    if comment:
+        result += " #" + comment
+    return result
+
+
+def _is_shareable(prereqs):
+    return len(prereqs) >= _SHARE_MIN_LENGTH and "|" not in prereqs
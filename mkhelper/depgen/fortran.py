@@ -31,18 +31,40 @@
 import re
 
 from depgen import (
+    DEBUG_ALL,
     IncludeFinder,
     StreamStack,
     file_in_dir,
-    find_unquoted_string,
     open23,
+    unquoted_lexer,
 )
 
 
+class ParseContext(object):
+    __slots__ = [
+        "include_stack",
+        "current_module",
+        "current_module_is_extendable",
+    ]
+
+    def __init__(self):
+        self.include_stack = StreamStack()
+        self.current_module = None
+        self.current_module_is_extendable = False
+
+
 class Parser:
+    # matches the leading keyword of a line
+    _re_keyword = re.compile(r"^\s*([a-z]\w*)", re.I)
+
     _re_include = re.compile(r'^\s*include\s+([\'"])(.*?)\1\s*$', re.I)
     _re_line_continue_start = re.compile(r"^(.*)&\s*$")
     _re_line_continue_end = re.compile(r"^\s*&")
+
+    # single-pass lexers that skip the string literals
+    _re_line_lexer = unquoted_lexer(["!", ";"])
+    _re_semicolon_lexer = unquoted_lexer([";"])
+
     _re_module_start = re.compile(
         r"^\s*module\s+(?!(?:procedure|subroutine|function)\s)(\w+)\s*$", re.I
     )
@@ -53,13 +75,44 @@ class Parser:
         r"^\s*use(?:\s+|(?:\s*,\s*((?:non_)?intrinsic))?\s*::\s*)(\w+)", re.I
     )
     _re_module_end = re.compile(r"^\s*end\s+module(?:\s+(\w+))?\s*$", re.I)
-    _re_module_prefixed_procedure = re.compile(
-        r"^\s*(?:\w+(?:\(.*\))?\s+)*"
-        r"module\s+"
-        r"(?:\w+(?:\(.*\))?\s+)*(?:function|subroutine)",
-        re.I,
+    # keywords of the statements the parser is interested in and whether they
+    # must start a word (i.e. 'module' might be a part of 'submodule')
+    _prefilter_keywords = [
+        (b"use", True),
+        (b"module", False),
+        (b"include", True),
+    ]
+
+    # keywords a prefix of a procedure might start with (i.e. the attributes
+    # and the type specifications)
+    _procedure_prefix_keywords = frozenset(
+        [
+            "module",
+            "pure",
+            "impure",
+            "elemental",
+            "recursive",
+            "non_recursive",
+            "simple",
+            "integer",
+            "real",
+            "complex",
+            "logical",
+            "character",
+            "double",
+            "doubleprecision",
+            "doublecomplex",
+            "type",
+            "class",
+        ]
     )
 
+    # matches a token of a procedure prefix: a word, which might be followed
+    # by a parenthesized specification (e.g. 'type(t)'), the end of which is
+    # found by counting the parentheses
+    _re_prefix_token = re.compile(r"\s*(\w+)(\s*\()?")
+    _re_parenthesis = re.compile(r"[()]")
+
     def __init__(
         self,
         include_order=None,
@@ -68,6 +121,7 @@ class Parser:
         intrinsic_mods=None,
         external_mods=None,
         subparser=None,
+        dir_index=None,
     ):
         self.include_roots = include_roots
 
@@ -92,243 +146,389 @@ class Parser:
         self.module_use_callback = None
         self.extendable_module_callback = None
         self.debug_callback = None
+        # Level of the events reported to the debug callback (see DEBUG_DEPS
+        # and DEBUG_ALL), the reporting is disabled if the level is zero:
+        self.debug_level = 0
+
+        self._include_finder = IncludeFinder(
+            include_order, include_dirs, dir_index
+        )
 
-        self._include_finder = IncludeFinder(include_order, include_dirs)
+    @staticmethod
+    def prefilter(buf):
+        """
+        Checks whether the contents BUF (bytes) of a file might contain a
+        statement the parser is interested in.
+        """
+        # Searching for the substrings is much faster than scanning with a
+        # regular expression, and the candidates are rare:
+        buf = buf.lower()
+        for keyword, word_start in Parser._prefilter_keywords:
+            idx = buf.find(keyword)
+            while idx >= 0:
+                end_idx = idx + len(keyword)
+                if not (
+                    _is_word_byte(buf[end_idx : end_idx + 1])
+                    or (word_start and _is_word_byte(buf[idx - 1 : idx]))
+                ):
+                    # The keyword is commented out for sure if it is preceded
+                    # by an exclamation mark, which cannot be quoted or
+                    # uncovered by the removal of a block comment:
+                    prefix = buf[buf.rfind(b"\n", 0, idx) + 1 : idx]
+                    if b"!" not in prefix or (
+                        b"'" in prefix or b'"' in prefix or b"*/" in prefix
+                    ):
+                        return True
+                idx = buf.find(keyword, end_idx)
+
+        # A keyword might be split by a line continuation (e.g. 'us&' and
+        # '&e'), which requires a word character before the ampersand:
+        idx = buf.find(b"&", 1)
+        while idx >= 0:
+            if _is_word_byte(buf[idx - 1 : idx]):
+                return True
+            idx = buf.find(b"&", idx + 1)
+
+        return False
 
     def parse(self, stream, stream_name):
+        context = self.init_context(stream, stream_name)
+
+        for line in Parser.streamline_input(context.include_stack):
+            self.process_line(line, context)
+
+        context.include_stack.clear()
+
+        # return an empty iterator
+        return
+        # noinspection PyUnreachableCode
+        yield
+
+    def init_context(self, stream, stream_name):
         stream = self._get_stream_iterator(stream, stream_name)
 
-        include_stack = StreamStack()
-        include_stack.push(stream, stream_name)
-
-        current_module = None
-        current_module_is_extendable = False
-
-        for line in Parser.streamline_input(include_stack):
-            # module definition start
-            match = Parser._re_module_start.match(line)
-            if match:
-                module_name = match.group(1).lower()
-                current_module = module_name
-                if self.module_start_callback:
-                    self.module_start_callback(module_name)
-                if self.debug_callback:
-                    self.debug_callback(
-                        line, "module '{0}' (start)".format(module_name)
-                    )
-                continue
-
-            # submodule definition start
-            match = Parser._re_submodule_start.match(line)
-            if match:
-                module_name = match.group(1).lower()
-                parent_name = match.group(2)
-                if parent_name:
-                    parent_name = parent_name.lower()
-                submodule_name = match.group(3).lower()
-                if self.submodule_start_callback:
-                    self.submodule_start_callback(
-                        submodule_name, parent_name, module_name
-                    )
-                if self.debug_callback:
-                    self.debug_callback(
-                        line,
-                        "submodule '{0}'{1} of module '{2}' (start)".format(
-                            submodule_name,
-                            (
-                                " with parent '{0}'".format(parent_name)
-                                if parent_name
-                                else ""
-                            ),
-                            module_name,
-                        ),
-                    )
-                continue
-
-            # module used
-            match = Parser._re_module_use.match(line)
-            if match:
-                module_nature = match.group(1)
-                if module_nature:
-                    module_nature = module_nature.lower()
-                module_name = match.group(2).lower()
-                if module_nature == "intrinsic":
-                    if self.debug_callback:
-                        self.debug_callback(
-                            line,
-                            "ignored module usage "
-                            "('{0}' is explicitly intrinsic)".format(
-                                module_name
-                            ),
-                        )
-                elif (
-                    module_name in self.intrinsic_mods
-                    and module_nature != "non_intrinsic"
-                ):
-                    if self.debug_callback:
-                        self.debug_callback(
-                            line,
-                            "ignored module usage "
-                            "('{0}' is implicitly intrinsic)".format(
-                                module_name
-                            ),
-                        )
-                elif module_name in self.external_mods:
-                    if self.debug_callback:
-                        self.debug_callback(
-                            line,
-                            "ignored module usage "
-                            "('{0}' is external)".format(module_name),
-                        )
-                else:
-                    if self.module_use_callback:
-                        self.module_use_callback(module_name)
-                    if self.debug_callback:
-                        self.debug_callback(
-                            line,
-                            "used module '{0}'".format(module_name),
-                        )
-                continue
-
-            # include statement
-            match = Parser._re_include.match(line)
-            if match:
-                filename = match.group(2)
-                filepath = self._include_finder.find(
-                    filename,
-                    include_stack.root_name,
-                    include_stack.current_name,
+        context = ParseContext()
+        context.include_stack.push(stream, stream_name)
+
+        return context
+
+    def process_line(self, line, context):
+        """
+        Processes a (streamlined) LINE in the CONTEXT of the parsed stream.
+        """
+        # The handler is selected based on the leading keyword of the line.
+        # Most of the lines are executable statements, which do not have a
+        # handler:
+        match = Parser._re_keyword.match(line)
+        if not match:
+            return
+
+        keyword = match.group(1).lower()
+
+        handler = Parser._keyword_handlers.get(keyword, None)
+        if handler and handler(self, line, context):
+            return
+
+        if not (self.extendable_module_callback or self.debug_level):
+            return
+
+        # The prefix of a module procedure might start with an attribute or
+        # with the return type of a function:
+        if keyword in Parser._procedure_prefix_keywords and (
+            self._process_module_prefixed_procedure(line, context)
+        ):
+            return
+
+        if keyword == "end":
+            self._process_module_end(line, context)
+
+    def _process_module_start(self, line, context):
+        match = Parser._re_module_start.match(line)
+        if not match:
+            return False
+
+        module_name = match.group(1).lower()
+        context.current_module = module_name
+        if self.module_start_callback:
+            self.module_start_callback(module_name)
+        if self.debug_level:
+            self.debug_callback(line, "module '{0}' (start)", module_name)
+        return True
+
+    def _process_submodule_start(self, line, context):
+        match = Parser._re_submodule_start.match(line)
+        if not match:
+            return False
+
+        module_name = match.group(1).lower()
+        parent_name = match.group(2)
+        if parent_name:
+            parent_name = parent_name.lower()
+        submodule_name = match.group(3).lower()
+        if self.submodule_start_callback:
+            self.submodule_start_callback(
+                submodule_name, parent_name, module_name
+            )
+        if self.debug_level:
+            self.debug_callback(
+                line,
+                "submodule '{0}'{1} of module '{2}' (start)",
+                submodule_name,
+                " with parent '{0}'".format(parent_name) if parent_name else "",
+                module_name,
+            )
+        return True
+
+    def _process_module_use(self, line, context):
+        match = Parser._re_module_use.match(line)
+        if not match:
+            return False
+
+        module_nature = match.group(1)
+        if module_nature:
+            module_nature = module_nature.lower()
+        module_name = match.group(2).lower()
+        if module_nature == "intrinsic":
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line,
+                    "ignored module usage ('{0}' is explicitly intrinsic)",
+                    module_name,
                 )
-                if filepath:
-                    if not self.include_roots or any(
-                        [file_in_dir(filepath, d) for d in self.include_roots]
-                    ):
-                        include_stack.push(open23(filepath, "r"), filepath)
-                        if self.include_callback:
-                            self.include_callback(filepath)
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "included file '{0}'".format(filepath),
-                            )
-                    elif self.debug_callback:
-                        self.debug_callback(
-                            line,
-                            "ignored (file '{0}' is not "
-                            "in the source roots)".format(filepath),
-                        )
-                elif self.debug_callback:
-                    self.debug_callback(line, "ignored (file not found)")
-                continue
-
-            if not (self.extendable_module_callback or self.debug_callback):
-                continue
-
-            # procedure with the module prefix
-            match = Parser._re_module_prefixed_procedure.match(line)
-            if match:
-                if current_module:
-                    if current_module_is_extendable:
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "ignored module subroutine/function "
-                                "(module '{0}' is already known "
-                                "to be extendable)".format(current_module),
-                            )
-                    else:
-                        current_module_is_extendable = True
-                        if self.extendable_module_callback:
-                            self.extendable_module_callback(current_module)
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "module subroutine/function "
-                                "(module '{0}' is extendable)".format(
-                                    current_module
-                                ),
-                            )
-                elif self.debug_callback:
+        elif (
+            module_name in self.intrinsic_mods
+            and module_nature != "non_intrinsic"
+        ):
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line,
+                    "ignored module usage ('{0}' is implicitly intrinsic)",
+                    module_name,
+                )
+        elif module_name in self.external_mods:
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line,
+                    "ignored module usage ('{0}' is external)",
+                    module_name,
+                )
+        else:
+            if self.module_use_callback:
+                self.module_use_callback(module_name)
+            if self.debug_level:
+                self.debug_callback(line, "used module '{0}'", module_name)
+        return True
+
+    def _process_include(self, line, context):
+        match = Parser._re_include.match(line)
+        if not match:
+            return False
+
+        include_stack = context.include_stack
+        filename = match.group(2)
+        filepath = self._include_finder.find(
+            filename,
+            include_stack.root_name,
+            include_stack.current_name,
+        )
+        if filepath:
+            if not self.include_roots or any(
+                [file_in_dir(filepath, d) for d in self.include_roots]
+            ):
+                include_stack.push(open23(filepath, "r"), filepath)
+                if self.include_callback:
+                    self.include_callback(filepath)
+                if self.debug_level:
+                    self.debug_callback(line, "included file '{0}'", filepath)
+            elif self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line,
+                    "ignored (file '{0}' is not in the source roots)",
+                    filepath,
+                )
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "ignored (file not found)")
+        return True
+
+    def _process_module_prefixed_procedure(self, line, context):
+        if not Parser._is_module_prefixed_procedure(line):
+            return False
+
+        current_module = context.current_module
+        if current_module:
+            if context.current_module_is_extendable:
+                if self.debug_level >= DEBUG_ALL:
                     self.debug_callback(
                         line,
                         "ignored module subroutine/function "
-                        "(not in the module scope)",
+                        "(module '{0}' is already known to be extendable)",
+                        current_module,
                     )
-                continue
-
-            # module definition end
-            match = Parser._re_module_end.match(line)
-            if match:
-                if self.debug_callback:
-                    module_name = match.group(1)
-                    if module_name:
-                        module_name = module_name.lower()
+            else:
+                context.current_module_is_extendable = True
+                if self.extendable_module_callback:
+                    self.extendable_module_callback(current_module)
+                if self.debug_level:
                     self.debug_callback(
                         line,
-                        "module '{0}' (end, {1})".format(
-                            str(module_name),
-                            (
-                                (
-                                    (
-                                        "as expected"
-                                        if module_name == current_module
-                                        else "expected '{0}'".format(
-                                            current_module
-                                        )
-                                    )
-                                    if module_name
-                                    else "assumed '{0}'".format(current_module)
-                                )
-                                if current_module
-                                else "unexpected"
-                            ),
-                        ),
+                        "module subroutine/function "
+                        "(module '{0}' is extendable)",
+                        current_module,
                     )
-                current_module = None
-                current_module_is_extendable = False
-                continue
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(
+                line,
+                "ignored module subroutine/function "
+                "(not in the module scope)",
+            )
+        return True
 
-        include_stack.clear()
+    @staticmethod
+    def _is_module_prefixed_procedure(line):
+        # Checks whether the LINE starts with a prefix containing the keyword
+        # 'module' followed by the keyword 'function' or 'subroutine' (e.g.
+        # 'pure elemental module function'). Each character is visited once,
+        # which keeps the check linear in the length of the line.
+        is_module = False
+        pos = 0
+        while 1:
+            match = Parser._re_prefix_token.match(line, pos)
+            if not match:
+                return False
+            word = match.group(1).lower()
+            if word == "function" or word == "subroutine":
+                return is_module
+            is_module = is_module or word == "module"
+            pos = match.end()
+            if match.group(2):
+                depth = 1
+                for paren in Parser._re_parenthesis.finditer(line, pos):
+                    depth += 1 if paren.group() == "(" else -1
+                    if not depth:
+                        pos = paren.end()
+                        break
+                else:
+                    return False
 
-        # return an empty iterator
-        return
-        # noinspection PyUnreachableCode
-        yield
+    def _process_module_end(self, line, context):
+        match = Parser._re_module_end.match(line)
+        if not match:
+            return False
+
+        current_module = context.current_module
+        if self.debug_level >= DEBUG_ALL:
+            module_name = match.group(1)
+            if module_name:
+                module_name = module_name.lower()
+            self.debug_callback(
+                line,
+                "module '{0}' (end, {1})",
+                str(module_name),
+                (
+                    (
+                        (
+                            "as expected"
+                            if module_name == current_module
+                            else "expected '{0}'".format(current_module)
+                        )
+                        if module_name
+                        else "assumed '{0}'".format(current_module)
+                    )
+                    if current_module
+                    else "unexpected"
+                ),
+            )
+        context.current_module = None
+        context.current_module_is_extendable = False
+        return True
+
+    _keyword_handlers = {
+        "module": _process_module_start,
+        "submodule": _process_submodule_start,
+        "use": _process_module_use,
+        "include": _process_include,
+    }
 
     @staticmethod
     def streamline_input(stream):
-        stream = Parser.drop_comments_and_empty_lines(stream)
-        for line in stream:
-            # concatenate lines
-            while 1:
-                match = Parser._re_line_continue_start.match(line)
-                if not match:
-                    break
-
-                next_line = next(stream, None)
-                if next_line is None:
-                    break
-
-                line = match.group(1) + re.sub(
-                    Parser._re_line_continue_end, "", next_line
-                )
+        while 1:
+            statements = Parser.read_statements(stream)
+            if statements is None:
+                return
+            for statement in statements:
+                yield statement
+
+    @staticmethod
+    def read_statements(stream):
+        """
+        Reads the next logical line of the STREAM (i.e. concatenates the
+        continuation lines) and returns the list of the statements it consists
+        of or None if the stream is exhausted.
+        """
+        line, semicolons = Parser._read_line(stream)
+        if line is None:
+            return None
+
+        # concatenate lines (only the last fragment can be continued, the
+        # fragments are joined once)
+        fragments = []
+        while 1:
+            match = Parser._re_line_continue_start.match(line)
+            if not match:
+                break
+
+            next_line, _ = Parser._read_line(stream)
+            if next_line is None:
+                break
 
-            # split semicolons
-            while 1:
-                idx = find_unquoted_string(";", line)
-                if idx < 0:
-                    break
+            fragments.append(match.group(1))
+            line = Parser._re_line_continue_end.sub("", next_line, 1)
 
-                yield line[:idx] + "\n"
-                line = line[idx + 1 :]
+        if fragments:
+            fragments.append(line)
+            line = "".join(fragments)
+            # The split points of the physical lines are not valid for the
+            # logical one:
+            semicolons = None
 
-            yield line
+        if semicolons is None:
+            semicolons = [
+                m.start()
+                for m in Parser._re_semicolon_lexer.finditer(line)
+                if m.group(1)
+            ]
+
+        if not semicolons:
+            return [line]
+
+        # split semicolons
+        result = []
+        start_idx = 0
+        for idx in semicolons:
+            result.append(line[start_idx:idx] + "\n")
+            start_idx = idx + 1
+        result.append(line[start_idx:])
+        return result
 
     @staticmethod
-    def drop_comments_and_empty_lines(stream):
+    def _read_line(stream):
+        # Returns a tuple of the next line of the STREAM that is not empty after
+        # the removal of the comments and the list of indices of the unquoted
+        # semicolons in it, which are found in the same pass as the comment, or
+        # a tuple of Nones if the stream is exhausted:
         for line in stream:
-            comment_idx = find_unquoted_string("!", line)
-            if comment_idx >= 0:
-                line = line[:comment_idx] + "\n"
+            semicolons = []
+            if "!" in line or ";" in line:
+                for match in Parser._re_line_lexer.finditer(line):
+                    if match.group(1) == "!":
+                        line = line[: match.start()] + "\n"
+                        break
+                    elif match.group(1):
+                        semicolons.append(match.start())
             if line and not line.isspace():
-                yield line
+                return line, semicolons
+        return None, None
+
+
+def _is_word_byte(c):
+    return c.isalnum() or c == b"_"
@@ -0,0 +1,131 @@
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+
+import sys
+
+
+class Parser:
+    """
+    Single-pass equivalent of the chain of the preprocessor, line control and
+    Fortran parsers (any of which might be missing). Instead of stacking the
+    parsers as generators, each of which processes the output of the previous
+    one, each line is read and sent through all stages with plain function
+    calls. The parsers must not be chained with the subparser argument: their
+    settings and callbacks are used as they are.
+    """
+
+    def __init__(self, pp_parser=None, lc_parser=None, ftn_parser=None):
+        self.pp_parser = pp_parser
+        self.lc_parser = lc_parser
+        self.ftn_parser = ftn_parser
+
+    def parse(self, stream, stream_name):
+        pp_parser, lc_parser = self.pp_parser, self.lc_parser
+
+        if pp_parser:
+            pp_context = pp_parser.init_context(stream, stream_name)
+            pp_stack = pp_context.include_stack
+            pp_next_line = pp_parser.next_line
+
+        lc_process_line = lc_parser.process_line if lc_parser else None
+
+        if pp_parser or lc_parser:
+            # The output of the preprocessing stages:
+            def read_line():
+                while 1:
+                    if pp_parser:
+                        line = pp_next_line(pp_context)
+                        if line is None:
+                            pp_stack.clear()
+                            return None
+                    else:
+                        line = next(stream, None)
+                        if line is None:
+                            return None
+                    if lc_process_line and not lc_process_line(line):
+                        continue
+                    return line
+
+        else:
+            read_line = None
+
+        ftn_parser = self.ftn_parser
+        if ftn_parser is None:
+            if read_line:
+                while 1:
+                    line = read_line()
+                    if line is None:
+                        return
+                    yield line
+            else:
+                for line in stream:
+                    yield line
+            return
+
+        ftn_context = ftn_parser.init_context(
+            _LineSource(read_line) if read_line else stream, stream_name
+        )
+        ftn_stack = ftn_context.include_stack
+        ftn_read_statements = ftn_parser.read_statements
+        ftn_process_line = ftn_parser.process_line
+
+        while 1:
+            statements = ftn_read_statements(ftn_stack)
+            if statements is None:
+                break
+            for statement in statements:
+                ftn_process_line(statement, ftn_context)
+
+        ftn_stack.clear()
+
+
+class _LineSource(object):
+    __slots__ = ["_read_line"]
+
+    def __init__(self, read_line):
+        # Function that returns the next line or None at the end of the input
+        # (adapted to the iterator protocol expected by StreamStack):
+        self._read_line = read_line
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self._read_line()
+        if line is None:
+            raise StopIteration
+        return line
+
+    if sys.version_info < (3,):
+        next = __next__
+
+    def close(self):
+        pass
@@ -31,7 +31,7 @@
 import os
 import re
 
-from depgen import file_in_dir
+from depgen import DEBUG_ALL, file_in_dir
 
 
 class Parser:
@@ -47,32 +47,51 @@ class Parser:
         # Callbacks:
         self.lc_callback = None
         self.debug_callback = None
+        # Level of the events reported to the debug callback (see DEBUG_DEPS
+        # and DEBUG_ALL), the reporting is disabled if the level is zero:
+        self.debug_level = 0
+
+    @staticmethod
+    def prefilter(buf):
+        """
+        Checks whether the contents BUF (bytes) of a file might contain a line
+        control directive.
+        """
+        return b"#" in buf
 
     def parse(self, stream, stream_name):
         stream = self._get_stream_iterator(stream, stream_name)
 
         for line in stream:
-            match = Parser._re_lc.match(line)
-            if match:
-                filepath = match.group(1)
-                if os.path.isfile(filepath):
-                    if not self.include_roots or any(
-                        [file_in_dir(filepath, d) for d in self.include_roots]
-                    ):
-                        if self.lc_callback:
-                            self.lc_callback(filepath)
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line, "accepted file '{0}'".format(filepath)
-                            )
-                    elif self.debug_callback:
+            if self.process_line(line):
+                yield line
+
+    def process_line(self, line):
+        """
+        Processes a LINE of the parsed stream. Returns False if the line is a
+        line control directive and True otherwise.
+        """
+        match = Parser._re_lc.match(line)
+        if match:
+            filepath = match.group(1)
+            if os.path.isfile(filepath):
+                if not self.include_roots or any(
+                    [file_in_dir(filepath, d) for d in self.include_roots]
+                ):
+                    if self.lc_callback:
+                        self.lc_callback(filepath)
+                    if self.debug_level:
                         self.debug_callback(
-                            line,
-                            "ignored (file '{0}' is not "
-                            "in the source roots)".format(filepath),
+                            line, "accepted file '{0}'", filepath
                         )
-                elif self.debug_callback:
-                    self.debug_callback(line, "ignored (file not found)")
-                continue
+                elif self.debug_level >= DEBUG_ALL:
+                    self.debug_callback(
+                        line,
+                        "ignored (file '{0}' is not in the source roots)",
+                        filepath,
+                    )
+            elif self.debug_level >= DEBUG_ALL:
+                self.debug_callback(line, "ignored (file not found)")
+            return False
 
-            yield line
+        return True
@@ -0,0 +1,1622 @@
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import os
+import sys
+
+from depgen import (
+    DEBUG_ALL,
+    DEBUG_DEPS,
+    DirectoryIndex,
+    exhaust,
+    map23,
+    open23,
+    probes_changed,
+    stream23,
+    zip_longest23,
+)
+
+
+class ArgumentParser(argparse.ArgumentParser):
+    def convert_arg_line_to_args(self, arg_line):
+        try:
+            # Drop everything after the first occurrence of #:
+            arg_line = arg_line[: arg_line.index("#")]
+        except ValueError:
+            pass
+
+        result = []
+        # Do not regard consecutive whitespaces as a single separator:
+        for arg in arg_line.split(" "):
+            if arg:
+                result.append(arg)
+            elif result:
+                # The previous argument has a significant whitespace:
+                result[-1] += " "
+        return result
+
+
+def parse_args(argv):
+    parser = ArgumentParser(
+        fromfile_prefix_chars="@",
+        description="Generates OUTPUT makefile containing dependency rules for "
+        "the INPUT source file. Recognizes preprocessor `#include`, `#if` and "
+        "associated directives as well as Fortran `INCLUDE`, `USE` and "
+        "`MODULE` statements.",
+    )
+
+    def comma_splitter(s):
+        return list(filter(None, s.lower().split(",")))
+
+    def path_splitter(s):
+        return list(filter(None, s.split(":")))
+
+    def default_obj_name(src_name):
+        if src_name:
+            src_no_ext_basename = os.path.splitext(os.path.basename(src_name))[
+                0
+            ]
+            if src_no_ext_basename:
+                return src_no_ext_basename + ".o"
+        return None
+
+    parser.add_argument(
+        "--input",
+        "-i",
+        metavar="INPUT",
+        nargs="+",
+        help="input source file; if not specified, the program reads from the "
+        "standard input stream",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        metavar="OUTPUT",
+        nargs="+",
+        help="output makefile with generated dependency rules; if not "
+        "specified, the program writes to the standard output stream",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="also write the generated dependencies together with the lists "
+        "of the included files and the provided and required modules in JSON "
+        "format to OUTPUT.json, which deplist.py reads instead of parsing the "
+        "OUTPUT",
+    )
+    parser.add_argument(
+        "--keep-unchanged",
+        action="store_true",
+        help="do not rewrite the OUTPUT (and, therefore, keep its modification "
+        "time) if its contents would not change; note that an unchanged OUTPUT "
+        "stays older than the INPUT and is regenerated on each run of make "
+        "unless the rule targets OUTPUT.stamp (see --check)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="record the fingerprint of the arguments (including the values "
+        "found for PP_INC_FLAG, PP_MACRO_FLAG, FC_INC_FLAG and "
+        "FC_MOD_DIR_FLAG but not the rest of the compiler flags) and the "
+        "digests of the contents of the INPUT and the files it includes in "
+        "the OUTPUT; an OUTPUT that has such a record matching the current "
+        "state is left untouched (together with OUTPUT.json), before the "
+        "parsers are even initialized; the debug information is not updated "
+        "in this case; OUTPUT.stamp is updated on each run (whether the OUTPUT "
+        "is regenerated or not) and is meant to be the target of the make "
+        "rule that runs depgen",
+    )
+    parser.add_argument(
+        "--check-macros",
+        action="store_true",
+        help="record the definitions (set with PP_MACRO_FLAG) of the macros "
+        "that affect the evaluation of the preprocessor conditional directives "
+        "in the OUTPUT; an OUTPUT that has such a record, the stamp of which "
+        "is newer than the INPUT and the files the latter includes, and that "
+        "was generated with the same arguments, except for the definitions of "
+        "other macros, is left "
+        "untouched (together with OUTPUT.json); the debug information is not "
+        "updated in this case; OUTPUT.stamp is updated as with --check",
+    )
+    parser.add_argument(
+        "--debug",
+        "-d",
+        nargs="?",
+        const="all",
+        choices=["deps", "all"],
+        help="dump debug information to OUTPUT.log (or to the standard error "
+        "stream if OUTPUT is not specified): either the events that explain "
+        "the dependencies ('deps') or all events ('all', default)",
+    )
+    parser.add_argument(
+        "--src-name",
+        metavar="SRC_NAME",
+        nargs="+",
+        help="name of the source file, the prerequisite of the corresponding "
+        "compilation rule as it will appear in the OUTPUT; normally (and by "
+        "default) equals to the INPUT or to an empty string when the latter is "
+        "set to the standard input stream",
+    )
+    parser.add_argument(
+        "--obj-name",
+        metavar="OBJ_NAME",
+        nargs="+",
+        help="name of the object file, the target of the corresponding "
+        "compilation rule as it will appear in the OUTPUT; normally equals to "
+        "the path to the object file that is supposed to be generated as a "
+        "result of compilation (default: SRC_NAME without the directory-part "
+        "and the file extension replaced with `.o`)",
+    )
+    parser.add_argument(
+        "--dep-name",
+        metavar="DEP_NAME",
+        nargs="+",
+        help="name of the generated makefile, the additional target of the "
+        "corresponding compilation rule (for automatic dependency generation) "
+        "as it will appear in the OUTPUT; normally (and by default) equals to "
+        "the OUTPUT or to an empty string when the latter is set to the "
+        "standard output stream)",
+    )
+    parser.add_argument(
+        "--src-roots",
+        metavar="SRC_ROOTS",
+        type=path_splitter,
+        help="colon-separated list of paths to directories; if specified and "
+        "not empty, dependencies on files that do not reside in one of the "
+        "specified directories will be ignored; applies only to files included "
+        "using the preprocessor `#include` directive or the Fortran `INCLUDE` "
+        "statement",
+    )
+    parser.add_argument(
+        "--lc-enable",
+        action="store_true",
+        help="enable recognition of the preprocessor line control directives "
+        "and generation of additional dependencies based on the detected "
+        "filenames",
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="send each line of the INPUT through all enabled stages (the "
+        "preprocessor, the line control and the Fortran parsers) in a single "
+        "pass instead of stacking them as generators (the results are the "
+        "same)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        metavar="JOBS",
+        type=int,
+        default=1,
+        help="number of worker processes processing the INPUT files in "
+        "parallel; each process has its own parser chain and the OUTPUT is the "
+        "same as in the case of the sequential processing; in server mode (see "
+        "`--serve`), the number of processes serving the requests "
+        "concurrently; a non-positive value means the number of available "
+        "CPUs (default: `%(default)s`)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="CACHE_DIR",
+        help="directory for caching the parsing results; the results for an "
+        "INPUT file are reused if neither the file nor any of the files it "
+        "includes has changed and the arguments that affect the parsing are "
+        "the same; the net effects of the preprocessed headers on the macro "
+        "definitions and the preprocessed output are stored there as well; "
+        "the directory can be shared by several build directories",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="SOCKET",
+        help="run as a server listening on the Unix domain socket SOCKET; the "
+        "server expects requests from `depgen_client.py` containing the same "
+        "arguments as the ones accepted by this program, processes them "
+        "reusing the parser chain for requests with identical arguments (apart "
+        "from INPUT, OUTPUT, SRC_NAME, OBJ_NAME, DEP_NAME and "
+        "FC_MOD_STAMP_NAME), and replies with the contents of the standard "
+        "output and error streams; the requests are served by JOBS processes, "
+        "which should match the number of jobs of the parallel build, each "
+        "having its own set of parser chains; all other arguments are "
+        "ignored",
+    )
+    parser.add_argument(
+        "flags",
+        metavar="-- [$CPPFLAGS | $FCFLAGS]",
+        nargs="?",
+        default=argparse.SUPPRESS,
+        help="actual flags to be used in compilation, i.e. $(CPPFLAGS) or "
+        "$(FCFLAGS), must be given at the end of the command line following "
+        "the double dash separator (--); the program searches these flags for "
+        "(possibly multiple instances of) PP_INC_FLAG, PP_MACRO_FLAG, "
+        "FC_INC_FLAG and FC_MOD_DIR_FLAG; any values found are used in the "
+        "dependency generation (in the case of FC_MOD_DIR_FLAG, only the last "
+        "value found is used)",
+    )
+
+    scan_arg_group = parser.add_argument_group("scanning arguments")
+    scan_arg_group.add_argument(
+        "--input-list",
+        metavar="INPUT_LIST",
+        help="file containing a null-separated list of additional INPUT "
+        "files (e.g. generated with `find ... -print0`), which helps to avoid "
+        "the limit on the length of the command line; a single dash (-) "
+        "triggers reading from the standard input stream",
+    )
+    scan_arg_group.add_argument(
+        "--scan",
+        metavar="SCAN_ROOT",
+        nargs="+",
+        help="paths to directories to be searched recursively for additional "
+        "INPUT files with names matching SCAN_NAME; the files are processed in "
+        "the sorted order",
+    )
+    scan_arg_group.add_argument(
+        "--scan-name",
+        metavar="SCAN_NAME",
+        default="*.f90",
+        help="shell-like wildcard for the basenames of the INPUT files "
+        "searched in SCAN_ROOT (default: `%(default)s`)",
+    )
+    scan_arg_group.add_argument(
+        "--input-pattern",
+        metavar="INPUT_PATTERN",
+        default="%",
+        help="pattern that all INPUT values must match when names are derived "
+        "with the *_PATTERN arguments below; the pattern contains a single "
+        "`%%` character, which matches any non-empty substring (the stem) "
+        "similar to the pattern rules of GNU make (default: `%(default)s`)",
+    )
+    for metavar in (
+        "OUTPUT",
+        "SRC_NAME",
+        "OBJ_NAME",
+        "DEP_NAME",
+        "FC_MOD_STAMP_NAME",
+    ):
+        scan_arg_group.add_argument(
+            "--{0}-pattern".format(metavar.lower().replace("_", "-")),
+            metavar="{0}_PATTERN".format(metavar),
+            help="pattern for {0} values, which are not set explicitly; the "
+            "`%%` character of the pattern is replaced with the stem of the "
+            "respective INPUT value (see INPUT_PATTERN){1}".format(
+                metavar,
+                (
+                    "; missing parent directories of the OUTPUT files are "
+                    "created"
+                    if metavar == "OUTPUT"
+                    else ""
+                ),
+            ),
+        )
+
+    pp_arg_group = parser.add_argument_group("preprocessor arguments")
+    pp_arg_group.add_argument(
+        "--pp-enable",
+        action="store_true",
+        help="enable the preprocessing stage; if disabled (default), all "
+        "arguments of this argument group are ignored",
+    )
+    pp_arg_group.add_argument(
+        "--pp-eval-expr",
+        action="store_true",
+        help="enable evaluation of expressions that appear in preprocessor "
+        "directives `#if` and `#elif` (does not apply to `#ifdef` and "
+        "`#ifndef`, which are always evaluated); if disabled (default) or "
+        "evaluation fails, both branches of the directives are included by the "
+        "preprocessing stage",
+    )
+    pp_arg_group.add_argument(
+        "--pp-inc-sys",
+        action="store_true",
+        help="enable recognition of dependencies specified with the "
+        "angle-bracket form of the preprocessor `#include` directive (i.e. "
+        "`#include <filename>`); the constraint set by SRC_ROOTS applies",
+    )
+    pp_arg_group.add_argument(
+        "--pp-inc-order",
+        default="inc,flg",
+        metavar="ORDER_LIST",
+        type=comma_splitter,
+        help="directory search order of files included using the quoted form "
+        "of the preprocessor `#include` directive (i.e. "
+        '`#include "filename"`) ; ORDER_LIST is an ordered comma-separated '
+        "list of keywords, the corresponding search paths of which are to be "
+        "searched in the given order. The recognized keywords are: `cwd` (for "
+        "the current working directory), `flg` (for the directories specified "
+        "with PP_INC_FLAG compiler flag), `src` (for the directory containing "
+        "the INPUT source file), and `inc` (for the directory containing the "
+        "file with the `#include` directive). Default: `%(default)s`.",
+    )
+    pp_arg_group.add_argument(
+        "--pp-inc-sys-order",
+        default="flg",
+        metavar="ORDER_LIST",
+        type=comma_splitter,
+        help="equivalent to the `--pp-inc-order` argument, only for the "
+        "angle-bracket form of the preprocessor `#include` directive (i.e. "
+        "`#include <filename>`, default: `%(default)s`)",
+    )
+    pp_arg_group.add_argument(
+        "--pp-macro-flag",
+        metavar="PP_MACRO_FLAG",
+        default="-D",
+        help="preprocessor flag used for macro definition; only flags that "
+        "start with a single dash (-) and have no more than one trailing "
+        "whitespace are supported (default: `%(default)s`)",
+    )
+    pp_arg_group.add_argument(
+        "--pp-inc-flag",
+        metavar="PP_INC_FLAG",
+        default="-I",
+        help="preprocessor flag used for setting search paths for the "
+        "`#include` directive; only flags that start with a single dash (-) "
+        "and have no more than one trailing whitespace are supported (default: "
+        "`%(default)s`)",
+    )
+
+    fc_arg_group = parser.add_argument_group("Fortran arguments")
+    fc_arg_group.add_argument(
+        "--fc-enable",
+        action="store_true",
+        help="enable recognition of Fortran dependencies specified with "
+        "`INCLUDE`, `USE` and `MODULE` statements; if disabled (default), all "
+        "arguments of this argument group are ignored",
+    )
+    fc_arg_group.add_argument(
+        "--fc-mod-stamp-name",
+        metavar="FC_MOD_STAMP_NAME",
+        nargs="+",
+        help="name of the Fortran module stamp file (a.k.a witness or anchor), "
+        "the prerequisite of the Fortran module and submodule files that are "
+        "generated as a result of, and an extra target of the Fortran module "
+        "and submodule files that are required for the compilation of SRC_NAME "
+        "as it will appear in the OUTPUT; normally (and by default) equals to "
+        "the OBJ_NAME",
+    )
+    fc_arg_group.add_argument(
+        "--fc-mod-ext",
+        default="mod",
+        help="filename extension (without leading dot) of compiler-generated "
+        "Fortran module files (default: `%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-mod-upper",
+        choices=["yes", "no"],
+        default="no",
+        help="whether Fortran compiler-generated module files have uppercase "
+        "names (default: `%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-smod-ext",
+        default="smod",
+        help="filename extension (without leading dot) of compiler-generated "
+        "Fortran submodule files (default: `%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-smod-infix",
+        default="@",
+        help="filename infix of compiler-generated Fortran submodule files, "
+        "i.e. a string in the basename of the submodule filename that appears "
+        "between the name of the ancestor module and the name of the "
+        "submodule; an empty value of the argument means that the compiler "
+        "does not prefix submodule filenames with the names of their ancestor "
+        "modules (default: `%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-root-smod",
+        choices=["yes", "no"],
+        default="yes",
+        help="whether Fortran compiler generates submodule files for the root "
+        "module ancestors (default: `%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-inc-order",
+        default="src,flg",
+        metavar="ORDER_LIST",
+        type=comma_splitter,
+        help="equivalent to the `--pp-inc-order` argument, only for the "
+        "Fortran `INCLUDE` statement and FC_INC_FLAG (default: `%(default)s`)",
+    )
+    fc_intrisic_mods_default = (
+        "iso_c_binding,iso_fortran_env,ieee_exceptions,"
+        "ieee_arithmetic,ieee_features,omp_lib,"
+        "omp_lib_kinds,openacc"
+    )
+    fc_arg_group.add_argument(
+        "--fc-intrinsic-mods",
+        metavar="FC_INTRINSIC_MODS_LIST",
+        type=comma_splitter,
+        action="append",
+        help="comma-separated list of Fortran intrinsic modules. Fortran "
+        "modules that are explicitly specified as intrinsic in the source file "
+        "(i.e. `USE, INTRINSIC :: MODULENAME`) are ignored regardless of "
+        "whether they are mentioned on the FC_INTRINSIC_MODS_LIST. Fortran "
+        "modules that are mentioned on the FC_INTRINSIC_MODS_LIST are ignored "
+        "only when their nature is not specified in the source file at all "
+        "(i.e. `USE :: MODULENAME`). Fortran modules that need to be ignored "
+        "unconditionally must be put on the FC_EXTERNAL_MODS_LIST (see "
+        "`--fc-external-mods`). Default: `{0}`.".format(
+            fc_intrisic_mods_default
+        ),
+    )
+    fc_arg_group.add_argument(
+        "--fc-external-mods",
+        metavar="FC_EXTERNAL_MODS_LIST",
+        type=comma_splitter,
+        action="append",
+        help="comma-separated list of external (to the project) Fortran "
+        "modules that need to be unconditionally ignored when generating "
+        "dependency rules (see also `--fc-intrinsic-mods`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-mod-dir-flag",
+        metavar="FC_MOD_DIR_FLAG",
+        default="-J",
+        help="Fortran compiler flag used to specify the directory where module "
+        "files are saved; only flags that start with a single dash (-) and "
+        "have no more than one trailing whitespace are supported (default: "
+        "`%(default)s`)",
+    )
+    fc_arg_group.add_argument(
+        "--fc-inc-flag",
+        metavar="FC_INC_FLAG",
+        default="-I",
+        help="preprocessor flag used for setting search paths for the Fortran "
+        "`INCLUDE` statement; only flags that start with a single dash (-) and "
+        "have no more than one trailing whitespace are supported (default: "
+        "`%(default)s`)",
+    )
+
+    unknown = []
+    try:
+        sep_idx = argv.index("--")
+        args = parser.parse_args(argv[:sep_idx])
+        unknown = argv[sep_idx + 1 :]
+    except ValueError:
+        args = parser.parse_args(argv)
+
+    args.debug = {"deps": DEBUG_DEPS, "all": DEBUG_ALL}.get(args.debug, 0)
+
+    if args.input_list:
+        if args.input_list == "-":
+            input_list = sys.stdin.read()
+        else:
+            with open23(args.input_list) as f:
+                input_list = f.read()
+        args.input = (args.input or []) + list(
+            filter(None, input_list.split("\0"))
+        )
+
+    if args.scan:
+        args.input = (args.input or []) + scan_inputs(args.scan, args.scan_name)
+
+    if not args.input:
+        args.input = (None,)
+
+    name_patterns = [
+        (dest, getattr(args, dest + "_pattern"))
+        for dest in (
+            "output",
+            "src_name",
+            "obj_name",
+            "dep_name",
+            "fc_mod_stamp_name",
+        )
+        if getattr(args, dest + "_pattern") and not getattr(args, dest)
+    ]
+
+    if name_patterns:
+        if "%" not in args.input_pattern:
+            parser.error("INPUT_PATTERN must contain the `%` character")
+        stems = []
+        for inp in args.input:
+            stem = pattern_stem(args.input_pattern, inp) if inp else None
+            if stem is None:
+                parser.error(
+                    "INPUT '{0}' does not match INPUT_PATTERN '{1}'".format(
+                        inp, args.input_pattern
+                    )
+                )
+            stems.append(stem)
+        for dest, pattern in name_patterns:
+            setattr(args, dest, [pattern.replace("%", s, 1) for s in stems])
+
+    if args.jobs < 1:
+        import multiprocessing
+
+        args.jobs = multiprocessing.cpu_count()
+
+    if not args.src_name:
+        args.src_name = args.input
+    elif len(args.src_name) != len(args.input):
+        parser.error(
+            "number of SRC_NAME values is not equal to the number of "
+            "INPUT values"
+        )
+
+    if not args.obj_name:
+        args.obj_name = map23(default_obj_name, args.src_name)
+    elif len(args.obj_name) != len(args.input):
+        parser.error(
+            "number of OBJ_NAME values is not equal to the number of "
+            "INPUT values"
+        )
+
+    if not args.output:
+        args.output = ()
+    elif len(args.output) != len(args.input):
+        parser.error(
+            "number of OUTPUT values is not equal to the number of "
+            "INPUT values"
+        )
+
+    if args.json and not args.output:
+        parser.error("argument --json: OUTPUT is not specified")
+
+    if not args.dep_name:
+        args.dep_name = args.output
+    elif len(args.dep_name) != len(args.input):
+        parser.error(
+            "number of DEP_NAME values is not equal to the number of "
+            "INPUT values"
+        )
+
+    compiler_arg_dests = dict()
+
+    if args.pp_enable:
+        compiler_arg_dests.update(
+            pp_inc_dirs=args.pp_inc_flag, pp_macros=args.pp_macro_flag
+        )
+
+    if args.fc_enable:
+        compiler_arg_dests.update(
+            fc_inc_dirs=args.fc_inc_flag, fc_mod_dir=args.fc_mod_dir_flag
+        )
+
+    if compiler_arg_dests:
+        compiler_args = dict()
+        for dest, flag in compiler_arg_dests.items():
+            if not flag.startswith("-") or flag.endswith("  "):
+                parser.error("unsupported compiler/preprocessor flag " + flag)
+            # Several dests might share the same flag and we want them to share
+            # the same list of values in this the case:
+            val_list = compiler_args.get(flag, None)
+            if val_list is None:
+                val_list = []
+                compiler_args[flag] = val_list
+            setattr(args, dest, val_list)
+
+        appended_val_lists = []
+        for arg in unknown:
+            if arg.startswith("-"):
+                appended_val_lists *= 0
+                arg_ws = arg + " "
+                for flag, val_list in compiler_args.items():
+                    if flag == arg or flag == arg_ws:
+                        # If the current argument equals to a flag, which might
+                        # have a significant trailing whitespace, the next
+                        # argument on the command line is the flag's value:
+                        appended_val_lists.append(val_list)
+                    elif arg.startswith(flag):
+                        # If the current argument starts with a flag that does
+                        # not have a trailing whitespace, the suffix of the
+                        # argument is the flag's value:
+                        val_list.append(arg[len(flag) :])
+            elif appended_val_lists:
+                for val_list in appended_val_lists:
+                    val_list.append(arg)
+                appended_val_lists *= 0
+
+    if args.pp_enable and args.pp_macros:
+        import re
+
+        predefined_macros = dict()
+        for m in args.pp_macros:
+            match = re.match(r"^=*([a-zA-Z_]\w*)(\(.*\))?(?:=(.+))?$", m)
+            if match:
+                name = match.group(1)
+                if name != "defined":
+                    body = match.group(3) if match.group(3) else "1"
+                    predefined_macros[name] = (match.group(2), body)
+        args.pp_macros = predefined_macros
+
+    if args.fc_enable:
+        if not args.fc_mod_stamp_name:
+            args.fc_mod_stamp_name = args.obj_name
+        elif len(args.fc_mod_stamp_name) != len(args.input):
+            parser.error(
+                "number of FC_MOD_STAMP_NAME values is not equal to the number "
+                "of INPUT values"
+            )
+
+        args.fc_mod_upper = args.fc_mod_upper == "yes"
+        args.fc_root_smod = args.fc_root_smod == "yes"
+        args.fc_mod_dir = args.fc_mod_dir[-1] if args.fc_mod_dir else None
+
+        if args.fc_intrinsic_mods:
+            args.fc_intrinsic_mods = [
+                m for sublist in args.fc_intrinsic_mods for m in sublist
+            ]
+        else:
+            args.fc_intrinsic_mods = comma_splitter(fc_intrisic_mods_default)
+
+        if args.fc_external_mods:
+            args.fc_external_mods = [
+                m for sublist in args.fc_external_mods for m in sublist
+            ]
+    else:
+        args.fc_mod_stamp_name = ()
+
+    return args
+
+
+class ParserChain(object):
+    __slots__ = [
+        "parser",
+        "included_files",
+        "lc_files",
+        "provided_modules",
+        "required_modules",
+        "provided_submodules",
+        "required_submodules",
+        "macro_names",
+        "pp_debug_info",
+        "lc_debug_info",
+        "ftn_debug_info",
+        "cache",
+        "dir_index",
+        "prefilters",
+    ]
+
+    def __init__(self, args, persistent=False):
+        # PERSISTENT is True if the chain is kept to process the inputs of
+        # several runs (see serve).
+        self.included_files = set()
+        self.lc_files = set()
+        self.provided_modules = set()
+        self.required_modules = set()
+        self.provided_submodules = set()
+        self.required_submodules = set()
+        self.macro_names = set()
+
+        self.pp_debug_info = None
+        self.lc_debug_info = None
+        self.ftn_debug_info = None
+
+        def include_callback(filename):
+            self.included_files.add(filename)
+
+        # Directory listings shared by the parsers, which also keep the
+        # results of the include searches for the current input:
+        self.dir_index = DirectoryIndex()
+        self.dir_index.probes = dict()
+
+        # Checks of the raw contents of the inputs, one per parser:
+        self.prefilters = []
+
+        parser, pp_parser, lc_parser, ftn_parser = None, None, None, None
+        if args.pp_enable:
+            from depgen.preprocessor import Parser
+
+            parser = Parser(
+                include_order=args.pp_inc_order,
+                include_sys_order=args.pp_inc_sys_order,
+                include_dirs=args.pp_inc_dirs,
+                include_roots=args.src_roots,
+                try_eval_expr=args.pp_eval_expr,
+                inc_sys=args.pp_inc_sys,
+                predefined_macros=args.pp_macros,
+                subparser=None if args.single_pass else parser,
+                dir_index=self.dir_index,
+            )
+
+            parser.include_callback = include_callback
+            parser.macro_callback = lambda name: self.macro_names.add(name)
+            pp_parser = parser
+            self.prefilters.append(Parser.prefilter)
+
+            # Recording of the summaries of the headers pays off only if they
+            # are included again with the same macro definitions, i.e. while
+            # processing other inputs or in other runs:
+            if args.cache_dir or persistent or len(args.input) > 1:
+                from depgen.cache import HeaderCache
+
+                parser.header_cache = HeaderCache(
+                    args.cache_dir, chain_key(args)
+                )
+
+            if args.debug:
+                self.pp_debug_info = []
+                parser.debug_callback = (
+                    lambda line, msg, *msg_args: self.pp_debug_info.append(
+                        (line, msg, msg_args)
+                    )
+                )
+                parser.debug_level = args.debug
+
+        if args.lc_enable:
+            from depgen.line_control import Parser
+
+            parser = Parser(
+                include_roots=args.src_roots,
+                subparser=None if args.single_pass else parser,
+            )
+            parser.lc_callback = lambda filename: self.lc_files.add(filename)
+            lc_parser = parser
+            self.prefilters.append(Parser.prefilter)
+
+            if args.debug:
+                self.lc_debug_info = []
+                parser.debug_callback = (
+                    lambda line, msg, *msg_args: self.lc_debug_info.append(
+                        (line, msg, msg_args)
+                    )
+                )
+                parser.debug_level = args.debug
+
+        if args.fc_enable:
+            from depgen.fortran import Parser
+
+            parser = Parser(
+                include_order=args.fc_inc_order,
+                include_dirs=args.fc_inc_dirs,
+                include_roots=args.src_roots,
+                intrinsic_mods=args.fc_intrinsic_mods,
+                external_mods=args.fc_external_mods,
+                subparser=None if args.single_pass else parser,
+                dir_index=self.dir_index,
+            )
+
+            parser.include_callback = include_callback
+            ftn_parser = parser
+            self.prefilters.append(Parser.prefilter)
+            parser.module_start_callback = (
+                lambda module: self.provided_modules.add(module)
+            )
+            parser.submodule_start_callback = (
+                lambda submodule, parent, module: self.provided_submodules.add(
+                    (module, submodule)
+                )
+                or (
+                    self.required_submodules.add((module, parent))
+                    if parent or args.fc_root_smod
+                    else self.required_modules.add(module)
+                )
+            )
+            parser.module_use_callback = (
+                lambda module: self.required_modules.add(module)
+            )
+
+            if args.fc_root_smod:
+                parser.extendable_module_callback = (
+                    lambda module: self.provided_submodules.add((module, None))
+                )
+
+            if args.debug:
+                self.ftn_debug_info = []
+                parser.debug_callback = (
+                    lambda line, msg, *msg_args: self.ftn_debug_info.append(
+                        (line, msg, msg_args)
+                    )
+                )
+                parser.debug_level = args.debug
+
+        if args.single_pass and parser:
+            from depgen.fused import Parser
+
+            parser = Parser(pp_parser, lc_parser, ftn_parser)
+
+        self.parser = parser
+
+        if args.cache_dir:
+            from depgen.cache import ResultCache
+
+            self.cache = ResultCache(args.cache_dir, chain_key(args))
+        else:
+            self.cache = None
+
+    def process(self, inp):
+        if inp is None:
+            self.parse(sys.stdin, sys.stdin.name)
+            return
+
+        # The input is read at once: the contents are checked with the
+        # prefilters and, if they are worth parsing, hashed for the cache and
+        # parsed line by line:
+        with open(inp, "rb") as f:
+            data = f.read()
+
+        if not self.prefilter(data):
+            # None of the parsers can find anything in the input:
+            self.reset_debug_info()
+            return
+
+        results, digest = None, None
+        if self.cache:
+            from depgen.cache import data_digest
+
+            digest = data_digest(data)
+            results = self.cache.get(inp, digest)
+        if results is None:
+            self.parse(stream23(data), inp)
+            if self.cache:
+                self.cache.put(
+                    inp,
+                    digest,
+                    self.dump(),
+                    self.included_files,
+                    self.lc_files,
+                    self.probes(),
+                )
+        else:
+            self.load(results)
+
+    def prefilter(self, data):
+        # Checks whether the contents DATA (bytes) of the input are worth
+        # parsing line by line:
+        return any(prefilter(data) for prefilter in self.prefilters)
+
+    def parse(self, stream, stream_name):
+        self.reset_debug_info()
+
+        if self.parser:
+            exhaust(self.parser.parse(stream, stream_name))
+
+    def reset_debug_info(self):
+        if self.pp_debug_info is not None:
+            self.pp_debug_info = []
+        if self.lc_debug_info is not None:
+            self.lc_debug_info = []
+        if self.ftn_debug_info is not None:
+            self.ftn_debug_info = []
+
+    def dump(self):
+        return {
+            "included_files": list(self.included_files),
+            "lc_files": list(self.lc_files),
+            "provided_modules": list(self.provided_modules),
+            "required_modules": list(self.required_modules),
+            "provided_submodules": list(self.provided_submodules),
+            "required_submodules": list(self.required_submodules),
+            "macro_names": list(self.macro_names),
+            "probes": self.probes(),
+            "pp_debug_info": self.pp_debug_info,
+            "lc_debug_info": self.lc_debug_info,
+            "ftn_debug_info": self.ftn_debug_info,
+        }
+
+    def load(self, results):
+        self.included_files.update(results["included_files"])
+        self.lc_files.update(results["lc_files"])
+        self.provided_modules.update(results["provided_modules"])
+        self.required_modules.update(results["required_modules"])
+        # Submodules are (module, submodule) tuples:
+        self.provided_submodules.update(
+            tuple(m) for m in results["provided_submodules"]
+        )
+        self.required_submodules.update(
+            tuple(m) for m in results["required_submodules"]
+        )
+        self.macro_names.update(results["macro_names"])
+        self.dir_index.probes.update(
+            ((d, f), r) for d, f, r in results["probes"]
+        )
+        self.pp_debug_info = results["pp_debug_info"]
+        self.lc_debug_info = results["lc_debug_info"]
+        self.ftn_debug_info = results["ftn_debug_info"]
+
+    def clear(self):
+        self.included_files.clear()
+        self.lc_files.clear()
+        self.provided_modules.clear()
+        self.required_modules.clear()
+        self.provided_submodules.clear()
+        self.required_submodules.clear()
+        self.macro_names.clear()
+        self.dir_index.probes.clear()
+
+    def probes(self):
+        # Returns the sorted list of the arguments and the results of the
+        # checks made by the include searches for the current input:
+        return [
+            [d, f, r] for (d, f), r in sorted(self.dir_index.probes.items())
+        ]
+
+
+# Arguments that either differ from one compilation rule to another or control
+# the way the program runs and, therefore, do not affect the parser chain:
+_non_chain_args = set(
+    [
+        "input",
+        "output",
+        "src_name",
+        "obj_name",
+        "dep_name",
+        "fc_mod_stamp_name",
+        "jobs",
+        "json",
+        "keep_unchanged",
+        "check",
+        "check_macros",
+        "serve",
+        "cache_dir",
+        "input_list",
+        "scan",
+        "scan_name",
+        "input_pattern",
+        "output_pattern",
+        "src_name_pattern",
+        "obj_name_pattern",
+        "dep_name_pattern",
+        "fc_mod_stamp_name_pattern",
+    ]
+)
+
+
+def chain_key(args, ignored_args=()):
+    return repr(
+        sorted(
+            (k, sorted(v.items()) if isinstance(v, dict) else v)
+            for k, v in vars(args).items()
+            if k not in _non_chain_args and k not in ignored_args
+        )
+    )
+
+
+def gen_debug_info(section, events):
+    # The messages are formatted only when the debug information is written:
+    result = ["#\n# {0}:\n".format(section)]
+    result.extend(
+        "#  `{0}`:\t{1}\n".format(line.rstrip("\n"), msg.format(*msg_args))
+        for line, msg, msg_args in events
+    )
+    return result
+
+
+def scan_inputs(roots, name_pattern):
+    import fnmatch
+
+    result = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            result.extend(
+                os.path.join(dirpath, f)
+                for f in sorted(filenames)
+                if fnmatch.fnmatchcase(f, name_pattern)
+            )
+    return result
+
+
+def pattern_stem(pattern, name):
+    prefix, _, suffix = pattern.partition("%")
+    if len(name) > len(prefix) + len(suffix) and (
+        name.startswith(prefix) and name.endswith(suffix)
+    ):
+        return name[len(prefix) : len(name) - len(suffix)]
+    return None
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = parse_args(argv)
+
+    if args.serve:
+        serve(args.serve, args.jobs)
+    else:
+        generate(args, [sys.argv[0]] + argv)
+
+
+def generate(args, command, chain=None):
+    per_input_args = list(
+        zip_longest23(
+            args.output,
+            args.input,
+            args.src_name,
+            args.obj_name,
+            args.dep_name,
+            args.fc_mod_stamp_name,
+        )
+    )
+
+    if args.check:
+        outdated = []
+        for a in per_input_args:
+            if check_fingerprint(args, *a):
+                write_stamp(a[0])
+            else:
+                outdated.append(a)
+        if not outdated:
+            return
+        per_input_args = outdated
+
+    jobs = min(args.jobs, len(per_input_args))
+    if jobs > 1:
+        import multiprocessing
+
+        pool = multiprocessing.Pool(jobs, init_worker, (args, command))
+        # Results are returned in the order of the inputs:
+        results = pool.imap(
+            run_worker,
+            per_input_args,
+            chunksize=max(1, len(per_input_args) // (4 * jobs)),
+        )
+    else:
+        pool = None
+        if chain is None:
+            chain = ParserChain(args)
+        results = (gen_output(args, chain, command, *a) for a in per_input_args)
+
+    try:
+        for a, (result, debug_result, json_result) in zip_longest23(
+            per_input_args, results
+        ):
+            out = a[0]
+            if out and args.output_pattern:
+                out_dir = os.path.dirname(out)
+                try:
+                    os.makedirs(out_dir)
+                except OSError:
+                    if out_dir and not os.path.isdir(out_dir):
+                        raise
+            if result is None:
+                # The existing output is up-to-date and is left untouched:
+                write_stamp(out)
+                continue
+            if out is None:
+                sys.stdout.write(result)
+            else:
+                write_output(out, result, args.keep_unchanged)
+            if debug_result is not None:
+                # Keep the debug information out of the makefiles:
+                if out is None:
+                    sys.stderr.write(debug_result)
+                else:
+                    write_output(
+                        out + ".log", debug_result, args.keep_unchanged
+                    )
+            if json_result is not None:
+                write_output(out + ".json", json_result, args.keep_unchanged)
+            if out and (args.check or args.check_macros):
+                write_stamp(out)
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+
+
+# Parser chain of the worker process:
+_worker_state = None
+
+
+def init_worker(args, command):
+    global _worker_state
+    _worker_state = args, ParserChain(args), command
+
+
+def run_worker(per_input_args):
+    args, chain, command = _worker_state
+    return gen_output(args, chain, command, *per_input_args)
+
+
+def write_output(filename, contents, keep_unchanged):
+    if keep_unchanged:
+        try:
+            with open23(filename, "r") as f:
+                if f.read() == contents:
+                    return
+        except EnvironmentError:
+            pass
+
+    with open23(filename, "w") as f:
+        f.write(contents)
+
+
+def write_stamp(out):
+    # Creates or updates the stamp file of the OUTPUT, the modification time
+    # of which tells when the OUTPUT was last generated or found up-to-date
+    # (the OUTPUT itself is not touched in the latter case, so that the
+    # makefiles that depend on it are not updated):
+    with open23(out + ".stamp", "w"):
+        pass
+
+
+def gen_output(
+    args,
+    chain,
+    command,
+    out,
+    inp,
+    src_name,
+    obj_name,
+    dep_name,
+    mod_stamp_name,
+):
+    per_input_args = inp, src_name, obj_name, dep_name, mod_stamp_name
+
+    macro_state_key = None
+    if args.check_macros and out and inp:
+        macro_state_key = gen_fingerprint(args, per_input_args, ["pp_macros"])
+        if check_macro_state(args, out, inp, macro_state_key):
+            return None, None, None
+
+    chain.process(inp)
+
+    rules = gen_lc_deps(src_name, chain.lc_files)
+
+    include_targets = [obj_name, dep_name]
+    if obj_name != mod_stamp_name:
+        include_targets.append(mod_stamp_name)
+
+    rules.extend(
+        gen_include_deps(include_targets, src_name, chain.included_files)
+    )
+
+    if (
+        chain.provided_modules
+        or chain.required_modules
+        or chain.provided_submodules
+        or chain.required_submodules
+    ):
+        rules.extend(
+            gen_module_deps(
+                obj_name,
+                mod_stamp_name,
+                chain.provided_modules,
+                chain.required_modules,
+                chain.provided_submodules,
+                chain.required_submodules,
+                args.fc_mod_dir,
+                args.fc_mod_upper,
+                args.fc_mod_ext,
+                args.fc_smod_infix,
+                args.fc_smod_ext,
+            )
+        )
+
+    out_lines = [format_rule(*rule) for rule in rules]
+
+    if macro_state_key:
+        out_lines.insert(0, gen_macro_state(args, chain, macro_state_key))
+
+    if args.check and out and inp:
+        out_lines.insert(0, gen_check_state(args, chain, per_input_args))
+
+    json_lines = None
+    if args.json:
+        import json
+
+        json_lines = json.dumps(
+            {
+                "rules": rules,
+                "included_files": sorted(chain.included_files),
+                "lc_files": sorted(chain.lc_files),
+                "provided_modules": sorted(chain.provided_modules),
+                "required_modules": sorted(chain.required_modules),
+                # Submodules are (module, submodule) tuples, where the
+                # submodule might be None:
+                "provided_submodules": sorted(
+                    chain.provided_submodules, key=_submodule_key
+                ),
+                "required_submodules": sorted(
+                    chain.required_submodules, key=_submodule_key
+                ),
+            },
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        json_lines += "\n"
+
+    debug_lines = None
+    if args.debug:
+        debug_lines = [
+            "# Python version: ",
+            sys.version.replace("\n", " "),
+            "\n#\n",
+            "# Command:\n",
+            "#  ",
+            " ".join(command),
+            "\n#\n",
+            "# Parsed arguments:\n#  ",
+            "\n#  ".join([k + "=" + str(v) for k, v in vars(args).items()]),
+            "\n",
+        ]
+        if chain.pp_debug_info is not None:
+            debug_lines.extend(
+                gen_debug_info("Preprocessor", chain.pp_debug_info)
+            )
+        if chain.lc_debug_info is not None:
+            debug_lines.extend(
+                gen_debug_info("Line control", chain.lc_debug_info)
+            )
+        if chain.ftn_debug_info is not None:
+            debug_lines.extend(gen_debug_info("Fortran", chain.ftn_debug_info))
+        debug_lines = "".join(debug_lines)
+
+    chain.clear()
+
+    return "".join(out_lines), debug_lines, json_lines
+
+
+# Prefix of the leading comment lines of the OUTPUT holding the records that
+# help to decide whether the OUTPUT needs to be regenerated (see --check and
+# --check-macros):
+_STATE_MARKER = "#@"
+
+
+def gen_fingerprint(args, per_input_args, ignored_args=()):
+    # The fingerprint identifies the arguments the OUTPUT depends on, which,
+    # apart from the per-input ones, are those that affect the parser chain:
+    import hashlib
+
+    from depgen import encode23
+
+    return hashlib.sha1(
+        encode23(repr((chain_key(args, ignored_args), per_input_args)))
+    ).hexdigest()
+
+
+def gen_check_state(args, chain, per_input_args):
+    from depgen.cache import file_digest
+
+    return format_state(
+        "check",
+        {
+            "fingerprint": gen_fingerprint(args, per_input_args),
+            "files": [
+                [f, file_digest(f)]
+                for f in [per_input_args[0]] + sorted(chain.included_files)
+            ],
+            "lc_files": sorted(chain.lc_files),
+            "probes": chain.probes(),
+        },
+    )
+
+
+def check_fingerprint(
+    args, out, inp, src_name, obj_name, dep_name, mod_stamp_name
+):
+    # Checks whether the OUTPUT generated for the INPUT is up-to-date based on
+    # the fingerprint of the arguments and the digests of the files:
+    if not (out and inp):
+        return False
+
+    try:
+        state = read_states(out).get("check", None)
+        if state is None or state["fingerprint"] != gen_fingerprint(
+            args, (inp, src_name, obj_name, dep_name, mod_stamp_name)
+        ):
+            return False
+
+        from depgen.cache import file_digest
+
+        for filename, digest in state["files"]:
+            if file_digest(filename) != digest:
+                return False
+        for filename in state["lc_files"]:
+            if not os.path.isfile(filename):
+                return False
+        # A file that would be found now instead of the recorded one (or
+        # instead of none) also makes the OUTPUT outdated:
+        if probes_changed(state["probes"]):
+            return False
+
+        if args.json and not os.path.isfile(out + ".json"):
+            return False
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        return False
+    return True
+
+
+def gen_macro_state(args, chain, key):
+    predefined_macros = getattr(args, "pp_macros", None) or {}
+    return format_state(
+        "macros",
+        {
+            "key": key,
+            "files": sorted(chain.included_files | chain.lc_files),
+            "probes": chain.probes(),
+            "macros": dict(
+                (name, predefined_macros.get(name, None))
+                for name in chain.macro_names
+            ),
+        },
+    )
+
+
+def check_macro_state(args, out, inp, key):
+    # Checks whether the OUTPUT generated for the INPUT is up-to-date based on
+    # the record of the macro definitions:
+    try:
+        state = read_states(out).get("macros", None)
+        if state is None or state["key"] != key:
+            return False
+
+        # The files the OUTPUT is generated from must not have been modified
+        # since the OUTPUT was last generated or found up-to-date (the OUTPUT
+        # itself keeps the time of the generation, see write_stamp):
+        stamp_mtime = os.path.getmtime(out + ".stamp")
+        for filename in [inp] + state["files"]:
+            if os.path.getmtime(filename) >= stamp_mtime:
+                return False
+        # Newly created files are not detected by the modification times:
+        if probes_changed(state["probes"]):
+            return False
+
+        if args.json and not os.path.isfile(out + ".json"):
+            return False
+
+        predefined_macros = getattr(args, "pp_macros", None) or {}
+        for name, macro in state["macros"].items():
+            current = predefined_macros.get(name, None)
+            if (list(current) if current else None) != macro:
+                return False
+    except (EnvironmentError, ValueError, KeyError, TypeError):
+        return False
+    return True
+
+
+def format_state(name, state):
+    import json
+
+    return "{0}{1} {2}\n".format(
+        _STATE_MARKER,
+        name,
+        json.dumps(state, separators=(",", ":"), sort_keys=True),
+    )
+
+
+def read_states(filename):
+    # Returns a dictionary of the records stored in the leading comment lines
+    # of the OUTPUT FILENAME with format_state():
+    import json
+
+    result = {}
+    with open23(filename, "r") as f:
+        for line in f:
+            if not line.startswith(_STATE_MARKER):
+                break
+            name, _, state = line[len(_STATE_MARKER) :].partition(" ")
+            result[name] = json.loads(state)
+    return result
+
+
+def serve(socket_path, workers):
+    from depgen.server import StringIO23, serve_forever
+
+    chains = dict()
+
+    def process(cwd, argv, args):
+        if args.serve:
+            raise ValueError("nested server mode is not supported")
+        if None in args.input:
+            raise ValueError(
+                "reading from the standard input stream is not supported in "
+                "server mode"
+            )
+        # Relative search paths are resolved against the working directory,
+        # which is, therefore, a part of the key:
+        key = cwd, chain_key(args)
+        chain = chains.get(key, None)
+        if chain is None:
+            chain = ParserChain(args, True)
+            chains[key] = chain
+        else:
+            # The filesystem might have changed since the last request:
+            chain.dir_index.clear()
+        try:
+            generate(args, [sys.argv[0]] + argv, chain)
+        finally:
+            chain.clear()
+
+    def handler(cwd, argv):
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = StringIO23(), StringIO23()
+        exitcode = 1
+        try:
+            os.chdir(cwd)
+            args = None
+            try:
+                args = parse_args(argv)
+            except SystemExit as e:
+                # The arguments are invalid or the help message is requested
+                # (other instances of SystemExit must terminate the server):
+                exitcode = (
+                    e.code if isinstance(e.code, int) else int(bool(e.code))
+                )
+            if args is not None:
+                process(cwd, argv, args)
+                exitcode = 0
+        except Exception as e:
+            sys.stderr.write(
+                "{0}: error: {1}\n".format(os.path.basename(sys.argv[0]), e)
+            )
+        finally:
+            result = exitcode, sys.stdout.getvalue(), sys.stderr.getvalue()
+            sys.stdout, sys.stderr = stdout, stderr
+        return result
+
+    serve_forever(socket_path, handler, workers)
+
+
+# The functions below return lists of rules, which are tuples of the lists of
+# targets, prerequisites and hints (see deplist.py):
+
+
+def gen_lc_deps(src_name, lc_files):
+    result = []
+    if src_name and lc_files:
+        result.append(([src_name], sorted(lc_files), []))
+    return result
+
+
+def gen_include_deps(include_targets, src_name, included_files):
+    result = []
+    targets = list(filter(None, include_targets))
+    if targets:
+        # The source file must be the first prerequisite:
+        prereqs = list(filter(None, [src_name] + sorted(included_files)))
+        if prereqs:
+            result.append((targets, prereqs, []))
+    return result
+
+
+def gen_module_deps(
+    obj_name,
+    mod_stamp_name,
+    provided_modules,
+    required_modules,
+    provided_submodules,
+    required_submodules,
+    mod_dir,
+    mod_upper,
+    mod_ext,
+    smod_infix,
+    smod_ext,
+):
+    result = []
+
+    mod_stamp_name = mod_stamp_name or obj_name
+    if mod_stamp_name:
+        targets = sorted(
+            modules_to_filenames(provided_modules, mod_dir, mod_upper, mod_ext)
+        )
+        targets.extend(
+            sorted(
+                submodules_to_filenames(
+                    provided_submodules,
+                    mod_dir,
+                    mod_upper,
+                    smod_infix,
+                    smod_ext,
+                )
+            )
+        )
+
+        if targets:
+            result.append((targets, [mod_stamp_name], []))
+
+        prereqs = sorted(
+            modules_to_filenames(
+                # Do not depend on the provided modules:
+                [m for m in required_modules if m not in provided_modules],
+                mod_dir,
+                mod_upper,
+                mod_ext,
+            )
+        )
+
+        prereqs.extend(
+            sorted(
+                submodules_to_filenames(
+                    # Do not depend on the provided submodules:
+                    [
+                        m
+                        for m in required_submodules
+                        if m not in provided_submodules
+                    ],
+                    mod_dir,
+                    mod_upper,
+                    smod_infix,
+                    smod_ext,
+                )
+            )
+        )
+
+        if prereqs:
+            result.append(
+                (list(filter(None, (obj_name, mod_stamp_name))), prereqs, [])
+            )
+
+    if obj_name:
+        targets = sorted(
+            modules_to_filenames(
+                set(
+                    module
+                    for module, _ in provided_submodules
+                    # Do not depend on the provided modules:
+                    if module not in provided_modules
+                ),
+                mod_dir,
+                mod_upper,
+                mod_ext,
+            )
+        )
+
+        if mod_stamp_name != obj_name:
+            targets.append(mod_stamp_name)
+
+        if targets:
+            result.append((targets, [], [obj_name]))
+
+    return result
+
+
+def format_rule(targets, prereqs, hints):
+    fields = list(prereqs)
+    if hints:
+        fields.append("#-hint")
+        fields.extend(hints)
+    return "{0}: {1}\n".format(" ".join(targets), " ".join(fields))
+
+
+def modules_to_filenames(modules, directory, upprecase, extension):
+    result = modules
+    if upprecase:
+        result = map(lambda s: s.upper(), result)
+    if directory:
+        result = map(lambda s: os.path.join(directory, s), result)
+    if extension:
+        result = map(lambda s: "{0}.{1}".format(s, extension), result)
+    return result
+
+
+def submodules_to_filenames(submodules, directory, uppercase, infix, extension):
+    result = modules_to_filenames(
+        map(
+            lambda module_submodule: (
+                "{1}{0}{2}".format(infix, *module_submodule)
+                if infix and module_submodule[1]
+                else module_submodule[1] or module_submodule[0]
+            ),
+            submodules,
+        ),
+        directory,
+        uppercase,
+        extension,
+    )
+    return result
+
+
+def _submodule_key(module_submodule):
+    return module_submodule[0], module_submodule[1] or ""
@@ -28,18 +28,24 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
 import re
 
 from depgen import (
+    DEBUG_ALL,
     IncludeFinder,
     StreamStack,
+    encode23,
     file_in_dir,
-    find_unquoted_string,
+    file_stat,
     open23,
+    unquoted_lexer,
 )
 
 
 class Parser:
+    _re_directive = re.compile(r"^\s*#\s*([a-z]+)")
+
     _re_ifdef = re.compile(r"^\s*#\s*if(n)?def\s+([a-zA-Z_]\w*)")
     _re_if_expr = re.compile(r"^\s*#\s*if((?:\s|\().*)")
 
@@ -48,9 +54,13 @@ class Parser:
     _re_endif = re.compile(r"^\s*#\s*endif(?:\s.*)")
 
     _re_include = re.compile(r'^\s*#\s*include\s+(?:"(.*?)"|<(.*?)>)')
+    _re_pragma_once = re.compile(r"^\s*#\s*pragma\s+once\s*$")
     _re_define = re.compile(r"^\s*#\s*define\s+([a-zA-Z_]\w*)(\([^)]*\))?(.*)$")
     _re_undef = re.compile(r"^\s*#\s*undef\s+([a-zA-Z_]\w*)")
 
+    # single-pass lexer that skips the string literals
+    _re_block_comment_lexer = unquoted_lexer(["/*"])
+
     def __init__(
         self,
         include_order=None,
@@ -61,6 +71,7 @@ class Parser:
         inc_sys=False,
         predefined_macros=None,
         subparser=None,
+        dir_index=None,
     ):
         self.include_roots = include_roots
         self.try_eval_expr = try_eval_expr
@@ -68,233 +79,702 @@ class Parser:
 
         # Callbacks:
         self.include_callback = None
+        # Called at the end of the input for each macro that has affected the
+        # evaluation of the conditional directives, and, therefore, might
+        # affect the dependencies:
+        self.macro_callback = None
         self.debug_callback = None
+        # Level of the events reported to the debug callback (see DEBUG_DEPS
+        # and DEBUG_ALL), the reporting is disabled if the level is zero:
+        self.debug_level = 0
 
-        self._include_finder = IncludeFinder(include_order, include_dirs)
+        # Storage of the summaries of the included headers (e.g. an instance
+        # of depgen.cache.HeaderCache), which are applied instead of reading
+        # the headers again:
+        self.header_cache = None
+
+        self._include_finder = IncludeFinder(
+            include_order, include_dirs, dir_index
+        )
         self._include_sys_finder = IncludeFinder(
-            include_sys_order, include_dirs
+            include_sys_order, include_dirs, self._include_finder.dir_index
         )
 
         self._predefined_macros = predefined_macros
 
+        # Dictionary of the detected include guards: the keys are paths to the
+        # headers and the values are tuples of the modification times and
+        # sizes of the files (see file_stat) and the names of the guard
+        # macros:
+        self._include_guards = {}
+
         self._get_stream_iterator = (
             subparser.parse if subparser else lambda x, *_: x
         )
 
+    @staticmethod
+    def prefilter(buf):
+        """
+        Checks whether the contents BUF (bytes) of a file might contain a
+        directive or a continued line, i.e. whether the preprocessor might
+        report or change anything.
+        """
+        return b"#" in buf or b"\\\n" in buf or b"\\\r\n" in buf
+
     def parse(self, stream, stream_name):
+        context = self.init_context(stream, stream_name)
+
+        while 1:
+            line = self.next_line(context)
+            if line is None:
+                return
+            yield line
+
+    def init_context(self, stream, stream_name):
         stream = self._get_stream_iterator(stream, stream_name)
 
-        include_stack = StreamStack()
-        include_stack.push(stream, stream_name)
+        context = ParseContext(MacroHandler(self._predefined_macros))
+        context.include_stack.push(stream, stream_name)
+
+        return context
+
+    def next_line(self, context):
+        """
+        Returns the next line of the preprocessed output in the CONTEXT of the
+        parsed stream or None if the stream is exhausted.
+        """
+        include_stack = context.include_stack
+        branch_state = context.branch_state
+        header_records = context.header_records
+        guard_trackers = context.guard_trackers
+        while 1:
+            if context.replayed_lines:
+                return context.replayed_lines.pop()
+
+            line = Parser.read_line(include_stack, branch_state.is_dead())
+
+            if header_records or guard_trackers:
+                self._finish_headers(context)
 
-        branch_state = BranchState()
-        macro_handler = MacroHandler(self._predefined_macros)
+            if line is None:
+                if self.macro_callback:
+                    for name in context.macro_handler.used_names():
+                        self.macro_callback(name)
+                return None
 
-        for line in Parser.streamline_input(include_stack):
-            # if(n)def directive
-            match = Parser._re_ifdef.match(line)
+            if guard_trackers:
+                tracker = guard_trackers[-1]
+                if tracker.state >= 0 and tracker.depth == len(include_stack):
+                    tracker.update(line, branch_state.depth())
+
+            if self.process_line(line, context):
+                for record in header_records:
+                    record.lines.append(line)
+                return line
+
+    def process_line(self, line, context):
+        """
+        Processes a (streamlined) LINE in the CONTEXT of the parsed stream.
+        Returns True if the line is a part of the preprocessed output and False
+        if it is a directive or belongs to a dead branch.
+        """
+        # Most of the lines are not directives and are rejected with a single
+        # check. Otherwise, the handler is selected based on the name of the
+        # directive:
+        if "#" in line:
+            match = Parser._re_directive.match(line)
             if match:
-                macro, negate, state = match.group(2), bool(match.group(1)), 0
-                if not branch_state.is_dead():
-                    state = macro_handler.eval_defined(macro, negate)
-                    if self.debug_callback:
+                handler = Parser._directive_handlers.get(match.group(1), None)
+                if handler and handler(self, line, context):
+                    return False
+
+        return not context.branch_state.is_dead()
+
+    def _process_ifdef(self, line, context):
+        match = Parser._re_ifdef.match(line)
+        if not match:
+            return False
+
+        branch_state = context.branch_state
+        macro_handler = context.macro_handler
+
+        macro, negate, state = match.group(2), bool(match.group(1)), 0
+        if not branch_state.is_dead():
+            state = macro_handler.eval_defined(macro, negate)
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(line, "evaluated to {0}", state > 0)
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "was not evaluated (dead branch)")
+        branch_state.switch_if(state)
+        return True
+
+    def _process_if(self, line, context):
+        match = Parser._re_if_expr.match(line)
+        if not match:
+            return False
+
+        branch_state = context.branch_state
+        macro_handler = context.macro_handler
+
+        expr, state = match.group(1), 0
+        if not branch_state.is_dead():
+            if self.try_eval_expr:
+                state = macro_handler.eval_expression(expr)
+                if self.debug_level >= DEBUG_ALL:
+                    self.debug_callback(
+                        line,
+                        "evaluated to {0}",
+                        state > 0 if state else "Unknown (evaluation failed)",
+                    )
+            elif self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line, "was not evaluated (evaluation disabled)"
+                )
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "was not evaluated (dead branch)")
+        branch_state.switch_if(state)
+        return True
+
+    def _process_elif(self, line, context):
+        match = Parser._re_elif.match(line)
+        if not match:
+            return False
+
+        branch_state = context.branch_state
+        macro_handler = context.macro_handler
+
+        branch_state.switch_else()
+        expr, state = match.group(1), 0
+        if not branch_state.is_dead():
+            if self.try_eval_expr:
+                state = macro_handler.eval_expression(expr)
+                if self.debug_level >= DEBUG_ALL:
+                    self.debug_callback(
+                        line,
+                        "evaluated to {0}",
+                        state > 0 if state else "Unknown (evaluation failed)",
+                    )
+            elif self.debug_level >= DEBUG_ALL:
+                self.debug_callback(
+                    line, "was not evaluated (evaluation disabled)"
+                )
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "was not evaluated (dead branch)")
+        branch_state.switch_elif(state)
+        return True
+
+    def _process_else(self, line, context):
+        if not Parser._re_else.match(line):
+            return False
+
+        context.branch_state.switch_else()
+        return True
+
+    def _process_endif(self, line, context):
+        if not Parser._re_endif.match(line):
+            return False
+
+        context.branch_state.switch_endif()
+        return True
+
+    def _process_define(self, line, context):
+        branch_state = context.branch_state
+        macro_handler = context.macro_handler
+
+        if branch_state.is_dead() and self.debug_level < DEBUG_ALL:
+            return True
+
+        match = Parser._re_define.match(line)
+        if not match:
+            return False
+
+        if not branch_state.is_dead():
+            macro = match.group(1, 2, 3)
+            macro_handler.define(*macro)
+            for record in context.header_records:
+                record.macros.append(list(macro))
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(line, "accepted")
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "ignored (dead branch)")
+        return True
+
+    def _process_undef(self, line, context):
+        branch_state = context.branch_state
+        macro_handler = context.macro_handler
+
+        if branch_state.is_dead() and self.debug_level < DEBUG_ALL:
+            return True
+
+        match = Parser._re_undef.match(line)
+        if not match:
+            return False
+
+        if not branch_state.is_dead():
+            macro_handler.undefine(match.group(1))
+            for record in context.header_records:
+                record.macros.append([match.group(1)])
+            if self.debug_level >= DEBUG_ALL:
+                self.debug_callback(line, "accepted")
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "ignored (dead branch)")
+        return True
+
+    def _process_include(self, line, context):
+        include_stack = context.include_stack
+        branch_state = context.branch_state
+
+        if branch_state.is_dead() and self.debug_level < DEBUG_ALL:
+            return True
+
+        match = Parser._re_include.match(line)
+        if not match:
+            return False
+
+        if not branch_state.is_dead():
+            if match.lastindex == 1:  # quoted form
+                filepath = self._include_finder.find(
+                    match.group(1),
+                    include_stack.root_name,
+                    include_stack.current_name,
+                )
+            elif match.lastindex == 2:  # angle-bracket form
+                if self.inc_sys:
+                    filepath = self._include_sys_finder.find(
+                        match.group(2),
+                        include_stack.root_name,
+                        include_stack.current_name,
+                    )
+                else:
+                    if self.debug_level >= DEBUG_ALL:
+                        self.debug_callback(line, "ignored (system header)")
+                    return True
+            else:
+                if self.debug_level >= DEBUG_ALL:
+                    self.debug_callback(line, "ignored (internal error)")
+                return True
+
+            included = bool(filepath) and self._in_roots(filepath)
+
+            if context.header_records:
+                self._record_include(
+                    match.lastindex == 1,
+                    match.group(match.lastindex),
+                    include_stack.current_name,
+                    filepath,
+                    included,
+                    context,
+                )
+
+            if included:
+                if self.include_callback:
+                    self.include_callback(filepath)
+
+                stat = file_stat(filepath)
+                guard = self._include_guards.get(filepath, None)
+                if guard and guard[0] != stat:
+                    guard = None
+
+                if filepath in context.once_headers:
+                    # The summaries of the headers that are being read depend
+                    # on what has been included before:
+                    for record in context.header_records:
+                        record.valid = False
+                    if self.debug_level:
+                        self.debug_callback(line, "skipped (#pragma once)")
+                    return True
+                elif guard and context.macro_handler.eval_defined(guard[1]) > 0:
+                    if self.debug_level:
                         self.debug_callback(
-                            line, "evaluated to {0}".format(state > 0)
+                            line,
+                            "skipped (include guard '{0}' is defined)",
+                            guard[1],
                         )
-                elif self.debug_callback:
-                    self.debug_callback(line, "was not evaluated (dead branch)")
-                branch_state.switch_if(state)
-                continue
+                    return True
 
-            # if directive
-            match = Parser._re_if_expr.match(line)
-            if match:
-                expr, state = match.group(1), 0
-                if not branch_state.is_dead():
-                    if self.try_eval_expr:
-                        state = macro_handler.eval_expression(expr)
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "evaluated to {0}".format(
-                                    "Unknown (evaluation failed)"
-                                    if state == 0
-                                    else state > 0
-                                ),
-                            )
-                    elif self.debug_callback:
-                        self.debug_callback(
-                            line, "was not evaluated (evaluation disabled)"
+                if self.debug_level:
+                    self.debug_callback(line, "included file '{0}'", filepath)
+
+                # The summaries do not keep the events of all levels:
+                if self.header_cache is not None and (
+                    self.debug_level < DEBUG_ALL
+                ):
+                    if self._replay_header(filepath, line, context):
+                        return True
+                    context.header_records.append(
+                        _HeaderRecord(
+                            filepath,
+                            stat,
+                            context.macro_handler.digest(),
+                            len(include_stack) + 1,
+                            context.branch_state.snapshot(),
+                            context.macro_handler.used_count(),
                         )
-                elif self.debug_callback:
-                    self.debug_callback(line, "was not evaluated (dead branch)")
-                branch_state.switch_if(state)
-                continue
+                    )
 
-            # elif directive
-            match = Parser._re_elif.match(line)
-            if match:
-                branch_state.switch_else()
-                expr, state = match.group(1), 0
-                if not branch_state.is_dead():
-                    if self.try_eval_expr:
-                        state = macro_handler.eval_expression(expr)
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "evaluated to {0}".format(
-                                    "Unknown (evaluation failed)"
-                                    if state == 0
-                                    else state > 0
-                                ),
-                            )
-                    elif self.debug_callback:
-                        self.debug_callback(
-                            line, "was not evaluated (evaluation disabled)"
+                if stat and not guard:
+                    context.guard_trackers.append(
+                        _GuardTracker(
+                            filepath,
+                            stat,
+                            len(include_stack) + 1,
+                            context.branch_state.depth(),
                         )
-                elif self.debug_callback:
-                    self.debug_callback(line, "was not evaluated (dead branch)")
-                branch_state.switch_elif(state)
-                continue
+                    )
+                include_stack.push(open23(filepath, "r"), filepath)
+            elif filepath:
+                if self.debug_level >= DEBUG_ALL:
+                    self.debug_callback(
+                        line,
+                        "ignored (file '{0}' is not in the source roots)",
+                        filepath,
+                    )
+            elif self.debug_level >= DEBUG_ALL:
+                self.debug_callback(line, "ignored (file not found)")
+        elif self.debug_level >= DEBUG_ALL:
+            self.debug_callback(line, "ignored (dead branch)")
+        return True
 
-            # else directive
-            match = Parser._re_else.match(line)
-            if match:
-                branch_state.switch_else()
-                continue
+    def _in_roots(self, filepath):
+        return not self.include_roots or any(
+            [file_in_dir(filepath, d) for d in self.include_roots]
+        )
 
-            # endif directive
-            match = Parser._re_endif.match(line)
-            if match:
-                branch_state.switch_endif()
-                continue
+    @staticmethod
+    def _record_include(quoted, name, includer, filepath, included, context):
+        # Records the result of the search for an included file in the
+        # summaries of the headers that are being read:
+        event = [
+            quoted,
+            name,
+            includer,
+            filepath,
+            file_stat(filepath) if included else None,
+            included,
+        ]
+        for record in context.header_records:
+            record.includes.append(event)
 
-            if branch_state.is_dead() and self.debug_callback is None:
-                continue
+    def _replay_header(self, filepath, line, context):
+        # Applies the summary of the header FILEPATH, which is included with
+        # the LINE, if it is available and valid in the current CONTEXT.
+        # Returns True on success.
+        summary = self.header_cache.get(
+            filepath, context.macro_handler.digest()
+        )
+        if summary is None:
+            return False
 
-            # define directive
-            match = Parser._re_define.match(line)
-            if match:
-                if not branch_state.is_dead():
-                    macro_handler.define(*match.group(1, 2, 3))
-                    if self.debug_callback:
-                        self.debug_callback(line, "accepted")
-                elif self.debug_callback:
-                    self.debug_callback(line, "ignored (dead branch)")
-                continue
+        # The summary is not valid if any of the headers containing
+        # "#pragma once" that it includes has already been read (i.e. is
+        # skipped now):
+        if any(path in context.once_headers for path in summary["once"]):
+            return False
 
-            # undef directive
-            match = Parser._re_undef.match(line)
-            if match:
-                if not branch_state.is_dead():
-                    macro_handler.undefine(match.group(1))
-                    if self.debug_callback:
-                        self.debug_callback(line, "accepted")
-                elif self.debug_callback:
-                    self.debug_callback(line, "ignored (dead branch)")
-                continue
+        root_name = context.include_stack.root_name
+        includes = summary["includes"]
+        for quoted, name, includer, path, stat, included in includes:
+            finder = (
+                self._include_finder if quoted else self._include_sys_finder
+            )
+            if finder.find(name, root_name, includer) != path or (
+                included and file_stat(path) != stat
+            ):
+                return False
 
-            # include directive
-            match = Parser._re_include.match(line)
-            if match:
-                if not branch_state.is_dead():
-                    if match.lastindex == 1:  # quoted form
-                        filepath = self._include_finder.find(
-                            match.group(1),
-                            include_stack.root_name,
-                            include_stack.current_name,
-                        )
-                    elif match.lastindex == 2:  # angle-bracket form
-                        if self.inc_sys:
-                            filepath = self._include_sys_finder.find(
-                                match.group(2),
-                                include_stack.root_name,
-                                include_stack.current_name,
-                            )
-                        else:
-                            if self.debug_callback:
-                                self.debug_callback(
-                                    line, "ignored (system header)"
-                                )
-                            continue
-                    else:
-                        if self.debug_callback:
-                            self.debug_callback(
-                                line, "ignored (internal error)"
-                            )
-                        continue
-
-                    if filepath:
-                        if not self.include_roots or any(
-                            [
-                                file_in_dir(filepath, d)
-                                for d in self.include_roots
-                            ]
-                        ):
-                            include_stack.push(open23(filepath, "r"), filepath)
-                            if self.include_callback:
-                                self.include_callback(filepath)
-                            if self.debug_callback:
-                                self.debug_callback(
-                                    line, "included file '{0}'".format(filepath)
-                                )
-                        elif self.debug_callback:
-                            self.debug_callback(
-                                line,
-                                "ignored (file '{0}' "
-                                "is not in the source roots)".format(filepath),
-                            )
-                    elif self.debug_callback:
-                        self.debug_callback(line, "ignored (file not found)")
-                elif self.debug_callback:
-                    self.debug_callback(line, "ignored (dead branch)")
-                continue
+        for _, _, _, path, _, included in includes:
+            if included:
+                if self.include_callback:
+                    self.include_callback(path)
+                if self.debug_level:
+                    self.debug_callback(
+                        line,
+                        "included file '{0}' (replayed from the summary of "
+                        "'{1}')",
+                        path,
+                        filepath,
+                    )
 
-            if branch_state.is_dead():
-                continue
+        macro_handler = context.macro_handler
+        macro_handler.mark_used(summary["used"])
+        for macro in summary["macros"]:
+            if len(macro) > 1:
+                macro_handler.define(*macro)
+            else:
+                macro_handler.undefine(macro[0])
 
-            yield line
+        context.once_headers.update(summary["once"])
+
+        lines = summary["lines"]
+        context.replayed_lines = lines[::-1]
+
+        for record in context.header_records:
+            record.includes.extend(includes)
+            record.macros.extend(summary["macros"])
+            record.lines.extend(lines)
+            record.once.extend(summary["once"])
+
+        return True
+
+    def _process_pragma(self, line, context):
+        if not context.branch_state.is_dead() and Parser._re_pragma_once.match(
+            line
+        ):
+            filepath = context.include_stack.current_name
+            context.once_headers.add(filepath)
+            for record in context.header_records:
+                record.once.append(filepath)
+        # The directive is kept in the output:
+        return False
+
+    def _finish_headers(self, context):
+        # Stores the include guards and the summaries of the headers that have
+        # been read completely:
+        depth = len(context.include_stack)
+
+        guard_trackers = context.guard_trackers
+        while guard_trackers and guard_trackers[-1].depth > depth:
+            tracker = guard_trackers.pop()
+            if tracker.state == _GuardTracker.CLOSED:
+                self._include_guards[tracker.filepath] = (
+                    tracker.stat,
+                    tracker.macro,
+                )
+
+        header_records = context.header_records
+        while header_records and header_records[-1].depth > depth:
+            record = header_records.pop()
+            # The summary is valid only if the header is balanced in terms of
+            # the conditional directives:
+            if (
+                record.valid
+                and record.stat
+                and record.branch_state == context.branch_state.snapshot()
+            ):
+                self.header_cache.put(
+                    record.filepath,
+                    record.stat,
+                    record.macro_digest,
+                    {
+                        "lines": record.lines,
+                        "macros": record.macros,
+                        "includes": record.includes,
+                        "once": record.once,
+                        "used": sorted(
+                            context.macro_handler.used_names(record.used_start)
+                        ),
+                    },
+                )
+
+    _directive_handlers = {
+        "ifdef": _process_ifdef,
+        "ifndef": _process_ifdef,
+        "if": _process_if,
+        "elif": _process_elif,
+        "else": _process_else,
+        "endif": _process_endif,
+        "define": _process_define,
+        "undef": _process_undef,
+        "include": _process_include,
+        "pragma": _process_pragma,
+    }
 
     @staticmethod
-    def streamline_input(stream):
+    def read_line(stream, skip_dead=False):
+        """
+        Returns the next non-empty line of the STREAM with concatenated
+        continuation lines and removed block comments or None if the stream is
+        exhausted. If SKIP_DEAD is True, the lines that cannot contain a
+        directive (and therefore cannot revive a dead branch) are skipped.
+        """
         for line in stream:
+            # In a dead branch, the line can be skipped right away unless it
+            # might be (or might be continued with) a directive or might start
+            # a block comment hiding one:
+            if skip_dead and not (
+                "#" in line or "/*" in line or line.endswith("\\\n")
+            ):
+                continue
+
             # concatenate lines
-            while line.endswith("\\\n"):
-                line = line[:-2] + next(stream, "")
+            if line.endswith("\\\n"):
+                fragments = []
+                while line.endswith("\\\n"):
+                    fragments.append(line[:-2])
+                    line = next(stream, "")
+                fragments.append(line)
+                line = "".join(fragments)
 
             # remove block comments
-            while 1:
-                # Check whether the line contains an unquoted block comment
-                # initiator '/*':
-                start_idx = find_unquoted_string("/*", line)
-                if start_idx < 0:
-                    break
-                # Check whether the line contains a block comment
-                # terminator '*/' (even if it is quoted):
-                term_idx = line.find("*/", start_idx + 2)
-                while term_idx < 0:
-                    # The block is not terminated yet, read the next line:
-                    term_idx = len(line)
-                    try:
-                        line += next(stream)
-                        term_idx = line.find("*/", term_idx)
-                    except StopIteration:
-                        pass
-                else:
-                    # Replace the block of comments with a single
-                    # space:
-                    line = "{0} {1}".format(
-                        line[:start_idx], line[term_idx + 2 :]
-                    )
+            if "/*" in line:
+                line = Parser._remove_block_comments(line, stream)
 
             if not line or line.isspace():
                 continue
 
-            yield line
+            return line
+
+        return None
+
+    @staticmethod
+    def _remove_block_comments(line, stream):
+        # Replaces each block comment in the LINE with a single space. The line
+        # is scanned once: the search for the next unquoted block comment
+        # initiator '/*' resumes right after the removed comment, which is
+        # always outside of a string literal. The lines of the STREAM that are
+        # commented out are dropped without accumulating them.
+        pieces = []
+        copied_idx = pos = 0
+        while 1:
+            match = Parser._re_block_comment_lexer.search(line, pos)
+            if not match:
+                break
+            pos = match.end()
+            if not match.group(1):
+                continue
+            pieces.append(line[copied_idx : match.start()])
+            pieces.append(" ")
+            # Find the block comment terminator '*/' (even if it is quoted):
+            term_idx = line.find("*/", pos)
+            while term_idx < 0:
+                # The block is not terminated yet, the next line is commented
+                # out at least up to the terminator:
+                line = next(stream, None)
+                if line is None:
+                    return "".join(pieces)
+                term_idx = line.find("*/")
+            copied_idx = pos = term_idx + 2
+        pieces.append(line[copied_idx:])
+        return "".join(pieces)
+
+
+class ParseContext(object):
+    __slots__ = [
+        "include_stack",
+        "branch_state",
+        "macro_handler",
+        "header_records",
+        "replayed_lines",
+        "guard_trackers",
+        "once_headers",
+    ]
+
+    def __init__(self, macro_handler):
+        self.include_stack = StreamStack()
+        self.branch_state = BranchState()
+        self.macro_handler = macro_handler
+
+        # Stack of the summaries of the headers that are being read:
+        self.header_records = []
+        # Reversed list of the output lines of a header replayed from its
+        # summary:
+        self.replayed_lines = []
+
+        # Stack of the detectors of the include guards of the headers that are
+        # being read:
+        self.guard_trackers = []
+        # Set of the headers containing "#pragma once":
+        self.once_headers = set()
+
+
+class _GuardTracker(object):
+    # Detects whether a header follows the include guard idiom, i.e. all its
+    # non-empty lines (after removing comments) are enclosed in a single
+    # "#ifndef MACRO" ("#if !defined MACRO") block without "#else" and
+    # "#elif" branches.
+
+    _re_guard = re.compile(
+        r"^\s*#\s*(?:ifndef\s+([a-zA-Z_]\w*)|if\s*!\s*defined"
+        r"(?:\s*\(\s*([a-zA-Z_]\w*)\s*\)|\s+([a-zA-Z_]\w*)))\s*$"
+    )
+
+    # States:
+    EXPECT_GUARD = 0
+    IN_GUARD = 1
+    CLOSED = 2
+    NOT_GUARDED = -1
+
+    __slots__ = ["filepath", "stat", "depth", "branch_depth", "macro", "state"]
+
+    def __init__(self, filepath, stat, depth, branch_depth):
+        self.filepath = filepath
+        self.stat = stat
+        # Depth of the include stack while the header is being read:
+        self.depth = depth
+        # Number of the open conditional blocks at the point of the inclusion:
+        self.branch_depth = branch_depth
+        self.macro = None
+        self.state = _GuardTracker.EXPECT_GUARD
+
+    def update(self, line, branch_depth):
+        """
+        Updates the state based on the next (streamlined) LINE of the header
+        that is going to be processed when BRANCH_DEPTH conditional blocks are
+        open.
+        """
+        if branch_depth == self.branch_depth:
+            # Outside the guard block:
+            match = (
+                _GuardTracker._re_guard.match(line)
+                if self.state == _GuardTracker.EXPECT_GUARD
+                else None
+            )
+            if match:
+                self.macro = match.group(match.lastindex)
+                self.state = _GuardTracker.IN_GUARD
+            else:
+                self.state = _GuardTracker.NOT_GUARDED
+        elif branch_depth == self.branch_depth + 1 and "#" in line:
+            # Directly inside the guard block:
+            match = Parser._re_directive.match(line)
+            if match:
+                directive = match.group(1)
+                if directive == "endif":
+                    self.state = _GuardTracker.CLOSED
+                elif directive in ("else", "elif"):
+                    self.state = _GuardTracker.NOT_GUARDED
+
+
+class _HeaderRecord(object):
+    __slots__ = [
+        "filepath",
+        "stat",
+        "macro_digest",
+        "depth",
+        "branch_state",
+        "used_start",
+        "lines",
+        "macros",
+        "includes",
+        "once",
+        "valid",
+    ]
+
+    def __init__(
+        self, filepath, stat, macro_digest, depth, branch_state, used_start
+    ):
+        self.filepath = filepath
+        self.stat = stat
+        self.macro_digest = macro_digest
+        # Depth of the include stack while the header is being read:
+        self.depth = depth
+        # Snapshot of the branch state at the point of the inclusion:
+        self.branch_state = branch_state
+        # Number of the macro lookups made before the inclusion (see
+        # MacroHandler.used_count):
+        self.used_start = used_start
+
+        # The net effect of the header:
+        self.lines = []
+        self.macros = []
+        self.includes = []
+        self.once = []
+
+        self.valid = True
 
 
 class BranchState(object):
-    __slots__ = ["_if_state_stack", "_states_per_endif_stack"]
+    __slots__ = ["_if_state_stack", "_states_per_endif_stack", "_dead_count"]
 
     def __init__(self):
         # Stack of #if-#else blocks holds one of the following:
@@ -309,114 +789,621 @@ class BranchState(object):
         # stack:
         self._states_per_endif_stack = []
 
+        # Number of negative elements in the stack of #if-#else blocks (the
+        # current branch is dead if any of them is negative):
+        self._dead_count = 0
+
     def switch_if(self, state):
         self._if_state_stack.append(state)
         self._states_per_endif_stack.append(1)
+        if state < 0:
+            self._dead_count += 1
 
     def switch_else(self):
         if self._if_state_stack:
-            self._if_state_stack[-1] = -self._if_state_stack[-1]
+            state = self._if_state_stack[-1]
+            self._if_state_stack[-1] = -state
+            if state < 0:
+                self._dead_count -= 1
+            elif state > 0:
+                self._dead_count += 1
 
     def switch_elif(self, state):
         self._if_state_stack.append(state)
         self._states_per_endif_stack[-1] += 1
+        if state < 0:
+            self._dead_count += 1
 
     def switch_endif(self):
         if self._if_state_stack:
             pop_count = self._states_per_endif_stack.pop()
             for _ in range(pop_count):
-                self._if_state_stack.pop()
+                if self._if_state_stack.pop() < 0:
+                    self._dead_count -= 1
 
     def is_dead(self):
-        return any(state < 0 for state in self._if_state_stack)
+        return self._dead_count > 0
 
+    def depth(self):
+        return len(self._states_per_endif_stack)
 
-class MacroHandler(object):
-    # matches "defined MACRO_NAME" and "defined (MACRO_NAME)"
-    _re_defined_call = re.compile(
-        r"(defined\s*(\(\s*)?([a-zA-Z_]\w*)(?(2)\s*\)))"
-    )
+    def snapshot(self):
+        return list(self._if_state_stack), list(self._states_per_endif_stack)
 
-    # matches object-like and function-like macro identifiers
-    _re_identifier = re.compile(
-        r"(([a-zA-Z_]\w*)\s*(\(\s*(?:\w+(?:\s*,\s*\w+)*\s*)?\))?)"
-    )
 
-    __slots__ = ["_macros"]
+class MacroHandler(object):
+    __slots__ = ["_macros", "_version", "_expr_cache", "_digest", "_used"]
 
     def __init__(self, predefined_macros=None):
         self._macros = dict(predefined_macros or [])
 
+        # The version of the macro table is incremented each time the table
+        # changes, which invalidates the results of the evaluated expressions
+        # cached per version:
+        self._version = 0
+        self._expr_cache = {}
+
+        # The digest of the macro table is the sum of the digests of the
+        # definitions, which is updated incrementally:
+        self._digest = sum(
+            _macro_digest(name, macro) for name, macro in self._macros.items()
+        )
+
+        # The names of the macros looked up to evaluate the conditions (with
+        # repetitions), i.e. the macros the evaluation results depend on:
+        self._used = []
+
     def define(self, macro_name, macro_args=None, macro_body=None):
         if macro_name != "defined":
-            self._macros[macro_name] = (macro_args, macro_body or "")
+            macro = (macro_args, macro_body or "")
+            old_macro = self._macros.get(macro_name, None)
+            if old_macro != macro:
+                if old_macro is not None:
+                    self._digest -= _macro_digest(macro_name, old_macro)
+                self._digest += _macro_digest(macro_name, macro)
+                self._macros[macro_name] = macro
+                self._version += 1
 
     def undefine(self, macro_name):
-        self._macros.pop(macro_name, None)
+        macro = self._macros.pop(macro_name, None)
+        if macro is not None:
+            self._digest -= _macro_digest(macro_name, macro)
+            self._version += 1
+
+    def digest(self):
+        """
+        Returns a digest of the macro definitions.
+        """
+        return "{0:x}".format(self._digest & _DIGEST_MASK)
+
+    def used_names(self, start=0):
+        """
+        Returns the set of the names of the macros that have affected the
+        evaluated conditions starting from the START-th lookup (see used_count).
+        """
+        return set(self._used[start:])
+
+    def used_count(self):
+        """
+        Returns the number of the macro lookups made so far.
+        """
+        return len(self._used)
+
+    def mark_used(self, macro_names):
+        """
+        Records the lookups of the macros MACRO_NAMES made elsewhere (e.g.
+        while reading a header, the summary of which is being replayed).
+        """
+        self._used.extend(macro_names)
 
     def eval_defined(self, macro_name, negate=False):
+        self._used.append(macro_name)
         return 1 if bool(macro_name in self._macros) ^ negate else -1
 
     def eval_expression(self, expr):
-        prev_expr = None
-        while expr != prev_expr:
-            # replace calls to function "defined"
-            defined_calls = re.findall(MacroHandler._re_defined_call, expr)
-            for call in defined_calls:
-                expr = expr.replace(
-                    call[0], "1" if call[2] in self._macros else "0"
+        """
+        Evaluates the expression EXPR of an #if or #elif directive. Returns 1
+        if the expression evaluates to True, -1 if the expression evaluates to
+        False, and 0 if the evaluation fails.
+        """
+        key = (expr, self._version)
+        cached = self._expr_cache.get(key, None)
+        if cached is None:
+            start = len(self._used)
+            try:
+                value = _evaluate(self._expand(_tokenize(expr)))
+                result = 1 if value[0] else -1
+            except _ExpressionError:
+                result = 0
+            self._expr_cache[key] = result, self.used_names(start)
+        else:
+            result, used = cached
+            self._used.extend(used)
+        return result
+
+    def _expand(self, tokens, disabled=None):
+        # Replaces the macros in the list of TOKENS with their bodies (which
+        # are rescanned for more macros) and the calls to operator "defined"
+        # with ones or zeros. The tokens that are still to be processed are
+        # kept in reversed order to push the bodies of the expanded macros to
+        # the end of the list. The end of each body is marked to know when the
+        # macro can be expanded again. The names of the macros that cannot be
+        # expanded when they are met (DISABLED) are never expanded later:
+        result = []
+        pending = tokens[::-1]
+        disabled = set(disabled) if disabled else set()
+
+        def skip_macro_ends():
+            while pending and pending[-1].__class__ is _MacroEnd:
+                disabled.discard(pending.pop().name)
+
+        while pending:
+            token = pending.pop()
+            if token.__class__ is _MacroEnd:
+                disabled.discard(token.name)
+                continue
+
+            if token.__class__ is _DisabledName or not _is_identifier(token):
+                result.append(token)
+                continue
+
+            if token == "defined":
+                # matches "defined MACRO_NAME" and "defined (MACRO_NAME)"
+                skip_macro_ends()
+                name = pending.pop() if pending else ")"
+                if name == "(":
+                    name = pending.pop() if pending else ")"
+                    if not pending or pending.pop() != ")":
+                        raise _ExpressionError()
+                if name.__class__ is _MacroEnd or not _is_identifier(name):
+                    raise _ExpressionError()
+                self._used.append(name)
+                result.append("1" if name in self._macros else "0")
+                continue
+
+            self._used.append(token)
+            macro = self._macros.get(token, None)
+            if macro is None:
+                result.append(token)
+                continue
+            elif token in disabled:
+                result.append(_DisabledName(token))
+                continue
+
+            macro_args, macro_body = macro
+            if macro_args is None:
+                # expansion of an object-like macro
+                body = _tokenize(macro_body)
+                if "##" in body:
+                    body = _paste(body)
+            else:
+                # expansion of a function-like macro
+                skip_macro_ends()
+                if not pending or pending[-1] != "(":
+                    # the name of the macro is not followed by the argument
+                    # list and is not expanded
+                    result.append(token)
+                    continue
+                body = self._substitute(
+                    macro_args,
+                    macro_body,
+                    _pop_arguments(pending, disabled),
+                    disabled,
                 )
 
-            identifiers = re.findall(MacroHandler._re_identifier, expr)
-
-            for identifier, identifier_name, identifier_args in identifiers:
-
-                macro = self._macros.get(identifier_name, None)
-
-                if identifier_args:
-                    # expansion of a function-like identifier
-
-                    if macro is None:
-                        # the respective macro is not defined, which normally
-                        # results in a preprocessor error
-                        return 0
-                    elif macro[0] is None:
-                        # the respective macro is an object-like one: replace
-                        # the name of the function-like identifier with the body
-                        # (value) of the macro
-                        identifier_repl = macro[1] + identifier_args
-                    elif "".join(identifier_args.split()) == "()":
-                        # the argument list of the function-like identifier is
-                        # empty: replace the identifier with the body of the
-                        # function-like macro
-                        identifier_repl = macro[1]
-                    else:
-                        # we cannot expand function-like macros but we might not
-                        # have to due to the short-circuit evaluation
-                        continue
+            disabled.add(token)
+            pending.append(_MacroEnd(token))
+            pending.extend(body[::-1])
+
+        return result
+
+    def _substitute(self, macro_args, macro_body, args, disabled):
+        # Returns the body of a function-like macro with the parameters
+        # replaced with the arguments ARGS of its call:
+        params = _parse_parameters(macro_args)
+        if params and params[-1][1]:
+            # collect the variable arguments
+            if len(args) == len(params) - 1:
+                args.append([])
+            elif len(args) > len(params):
+                variable_args = args[len(params) - 1]
+                for arg in args[len(params) :]:
+                    variable_args.append(",")
+                    variable_args.extend(arg)
+                del args[len(params) :]
+        elif not params and args == [[]]:
+            args = []
+
+        if len(args) != len(params):
+            raise _ExpressionError()
+
+        param_indices = dict((p[0], i) for i, p in enumerate(params))
+        expanded_args = {}
+
+        body = _tokenize(macro_body)
+        result = []
+        for i, token in enumerate(body):
+            if token == "#":
+                # stringification (the next token is processed here as well)
+                continue
+            idx = param_indices.get(token, None)
+            if i > 0 and body[i - 1] == "#":
+                if idx is None:
+                    raise _ExpressionError()
+                result.append(_stringify(args[idx]))
+            elif idx is None:
+                result.append(token)
+            elif (i > 0 and body[i - 1] == "##") or (
+                i + 1 < len(body) and body[i + 1] == "##"
+            ):
+                # operands of the token pasting are not macro-expanded
+                result.extend(args[idx] or [_PLACEMARKER])
+            else:
+                arg = expanded_args.get(idx, None)
+                if arg is None:
+                    arg = expanded_args[idx] = self._expand(args[idx], disabled)
+                result.extend(arg)
+
+        return _paste(result) if "##" in body else result
+
+
+def _macro_digest(name, macro):
+    return int(
+        hashlib.sha1(encode23(repr((name, macro[0], macro[1])))).hexdigest(),
+        16,
+    )
+
+
+_DIGEST_MASK = (1 << 160) - 1
+
+
+class _ExpressionError(Exception):
+    pass
+
+
+class _MacroEnd(object):
+    __slots__ = ["name"]
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _DisabledName(str):
+    # Name of a macro that is not expanded because it was met in its own body
+    # (or in the body of a macro that it expands to).
+    pass
+
+
+# Result of the expansion of an empty argument of the token pasting operator:
+_PLACEMARKER = ""
+
+# matches preprocessing numbers, identifiers, character constants, string
+# literals, operators and punctuators, and any other non-whitespace
+# character (invalid token)
+_re_token = re.compile(
+    r"(\.?\d(?:[eEpP][+-]|[\w.])*|[a-zA-Z_]\w*|'(?:[^'\\]|\\.)+'"
+    r'|"(?:[^"\\]|\\.)*"|&&|\|\||<<|>>|##|\+\+|--|[<>=!]=|\.\.\.'
+    r"|[-+*/%<>&|^!~?:(),#])|(\S)"
+)
+_re_integer = re.compile(
+    r"(?:0[xX]([0-9a-fA-F]+)|0([0-7]*)|([1-9]\d*))[uUlL]*$"
+)
+
+_BINARY_PRECEDENCE = {
+    "*": 10,
+    "/": 10,
+    "%": 10,
+    "+": 9,
+    "-": 9,
+    "<<": 8,
+    ">>": 8,
+    "<": 7,
+    "<=": 7,
+    ">": 7,
+    ">=": 7,
+    "==": 6,
+    "!=": 6,
+    "&": 5,
+    "^": 4,
+    "|": 3,
+    "&&": 2,
+    "||": 1,
+}
+
+_CHAR_ESCAPES = {
+    "n": 10,
+    "t": 9,
+    "v": 11,
+    "b": 8,
+    "r": 13,
+    "f": 12,
+    "a": 7,
+    "\\": 92,
+    "?": 63,
+    "'": 39,
+    '"': 34,
+}
+
+# Tokenized expressions and macro bodies:
+_token_cache = {}
+_TOKEN_CACHE_SIZE = 4096
+
+_INT_BITS = 64
+_UINT_MAX = (1 << _INT_BITS) - 1
+_INT_MAX = _UINT_MAX >> 1
+
+
+def _tokenize(expr):
+    # Returns the list of tokens of the expression EXPR. The lists are cached
+    # and must not be modified:
+    result = _token_cache.get(expr, None)
+    if result is not None:
+        return result
+
+    if len(_token_cache) > _TOKEN_CACHE_SIZE:
+        _token_cache.clear()
+
+    result = []
+    for token, invalid in _re_token.findall(expr):
+        if invalid:
+            raise _ExpressionError()
+        result.append(token)
+
+    _token_cache[expr] = result
+    return result
+
+
+def _is_identifier(token):
+    return token[0].isalpha() or token[0] == "_"
+
+
+def _parse_parameters(macro_args):
+    # Returns the list of parameters of a function-like macro defined with the
+    # argument list MACRO_ARGS (e.g. "(a, b, ...)"). Each parameter is a tuple
+    # of its name and a flag showing whether it collects variable arguments:
+    params = [p.strip() for p in macro_args[1:-1].split(",")]
+    if params == [""]:
+        return []
+    result = [(p, False) for p in params]
+    if params[-1].endswith("..."):
+        result[-1] = (params[-1][:-3].strip() or "__VA_ARGS__", True)
+    return result
+
+
+def _pop_arguments(pending, disabled):
+    # Pops the argument list of a function-like macro from the reversed list
+    # of PENDING tokens. Returns the list of arguments, each of which is a
+    # list of tokens.
+    pending.pop()
+    args, arg, depth = [], [], 1
+    while pending:
+        token = pending.pop()
+        if token.__class__ is _MacroEnd:
+            disabled.discard(token.name)
+            continue
+        elif token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                args.append(arg)
+                return args
+        elif token == "," and depth == 1:
+            args.append(arg)
+            arg = []
+            continue
+        arg.append(token)
+    raise _ExpressionError()
+
+
+def _stringify(tokens):
+    result = []
+    for token in tokens:
+        if token[0] in "'\"":
+            token = token.replace("\\", "\\\\").replace('"', '\\"')
+        result.append(token)
+    return '"{0}"'.format(" ".join(result))
+
+
+def _paste(tokens):
+    # Applies the token pasting operators in the list of TOKENS:
+    result = []
+    tokens = iter(tokens)
+    for token in tokens:
+        if token == "##" and result:
+            lhs, rhs = result.pop(), next(tokens, None)
+            if rhs is None:
+                raise _ExpressionError()
+            pasted = _tokenize(lhs + rhs)
+            if len(pasted) > 1:
+                raise _ExpressionError()
+            result.extend(pasted)
+        else:
+            result.append(token)
+    return [token for token in result if token != _PLACEMARKER]
+
+
+def _evaluate_constant(token):
+    # Returns the value and the signedness of the integer or character
+    # constant TOKEN:
+    if token[0] == "'":
+        char = token[1:-1]
+        if char[0] != "\\":
+            value = ord(char[0]) if len(char) == 1 else None
+        elif char[1:] in _CHAR_ESCAPES:
+            value = _CHAR_ESCAPES[char[1:]]
+        else:
+            try:
+                if char[1] in "01234567" and len(char) < 5:
+                    value = int(char[1:], 8)
+                elif char[1] == "x":
+                    value = int(char[2:], 16)
                 else:
-                    # expansion of an object-like identifier
-
-                    if macro is None or macro[0] is not None:
-                        # the respective macro is not defined or defined as a
-                        # function-like one: the identifier evaluates to False
-                        identifier_repl = "0"
-                    else:
-                        # the respective macro is defined as an object-like one:
-                        # replace the identifier with the body (value) of the
-                        # macro
-                        identifier_repl = macro[1]
-
-                expr = expr.replace(identifier, identifier_repl)
-
-            prev_expr = expr
-
-        expr = expr.replace("||", " or ")
-        expr = expr.replace("&&", " and ")
-        expr = expr.replace("!", "not ")
-
-        try:
-            result = bool(eval(expr, {"__builtins__": None}))
-            return 1 if result else -1
-        except Exception:
-            return 0
+                    value = None
+            except ValueError:
+                raise _ExpressionError()
+        if value is None:
+            raise _ExpressionError()
+        # The type char is signed (as with GCC on x86), therefore the single
+        # byte values with the highest bit set are negative:
+        if 0x80 <= value <= 0xFF:
+            value -= 0x100
+        return value, False
+
+    match = _re_integer.match(token)
+    if not match:
+        raise _ExpressionError()
+    hexadecimal, octal, decimal = match.groups()
+    if hexadecimal:
+        value = int(hexadecimal, 16)
+    elif decimal:
+        value = int(decimal)
+    else:
+        value = int(octal, 8) if octal else 0
+    if value > _UINT_MAX:
+        raise _ExpressionError()
+    return value, value > _INT_MAX or "u" in token or "U" in token
+
+
+def _evaluate(tokens):
+    # Evaluates the expanded list of TOKENS with the precedence climbing
+    # algorithm. Values are tuples of integers and their signedness flags.
+    # Subexpressions that do not need to be evaluated due to the
+    # short-circuit evaluation are parsed in the skip mode, which disables
+    # the errors that are caused by the values of the operands:
+    tokens = tokens[::-1]
+
+    def parse_comma(skip):
+        value = parse_conditional(skip)
+        while tokens and tokens[-1] == ",":
+            tokens.pop()
+            value = parse_conditional(skip)
+        return value
+
+    def parse_conditional(skip):
+        cond = parse_binary(1, skip)
+        if not tokens or tokens[-1] != "?":
+            return cond
+        tokens.pop()
+        lhs = parse_comma(skip or not cond[0])
+        if not tokens or tokens.pop() != ":":
+            raise _ExpressionError()
+        rhs = parse_conditional(skip or cond[0])
+        unsigned = lhs[1] or rhs[1]
+        return _wrap((lhs if cond[0] else rhs)[0], unsigned), unsigned
+
+    def parse_binary(min_precedence, skip):
+        lhs = parse_unary(skip)
+        while tokens:
+            op = tokens[-1]
+            precedence = _BINARY_PRECEDENCE.get(op, 0)
+            if precedence < min_precedence:
+                break
+            tokens.pop()
+            if op == "&&":
+                rhs = parse_binary(precedence + 1, skip or not lhs[0])
+                lhs = 1 if lhs[0] and rhs[0] else 0, False
+            elif op == "||":
+                rhs = parse_binary(precedence + 1, skip or lhs[0])
+                lhs = 1 if lhs[0] or rhs[0] else 0, False
+            else:
+                rhs = parse_binary(precedence + 1, skip)
+                lhs = _apply_binary(op, lhs, rhs, skip)
+        return lhs
+
+    def parse_unary(skip):
+        if not tokens:
+            raise _ExpressionError()
+        token = tokens.pop()
+        if token == "(":
+            value = parse_comma(skip)
+            if not tokens or tokens.pop() != ")":
+                raise _ExpressionError()
+            return value
+        elif token == "!":
+            return 0 if parse_unary(skip)[0] else 1, False
+        elif token == "-":
+            value, unsigned = parse_unary(skip)
+            return _wrap(-value, unsigned), unsigned
+        elif token == "+":
+            return parse_unary(skip)
+        elif token == "~":
+            value, unsigned = parse_unary(skip)
+            return _wrap(~value, unsigned), unsigned
+        elif _is_identifier(token):
+            # identifiers that are left after the expansion evaluate to zero
+            return 0, False
+        elif token[0] in "0123456789.'":
+            return _evaluate_constant(token)
+        raise _ExpressionError()
+
+    result = parse_comma(False)
+    if tokens:
+        raise _ExpressionError()
+    return result
+
+
+def _wrap(value, unsigned):
+    # Converts the integer VALUE to the range of the respective C type:
+    value &= _UINT_MAX
+    return value if unsigned or value <= _INT_MAX else value - _UINT_MAX - 1
+
+
+def _apply_binary(op, lhs, rhs, skip):
+    if op in ("<<", ">>"):
+        # the type of the result is the type of the left operand; shifts by
+        # negative or too large numbers of bits are defined as in GCC
+        (lhs, unsigned), count = lhs, rhs[0]
+        if count < 0:
+            op, count = "<<" if op == ">>" else ">>", -count
+        if op == ">>":
+            value = lhs >> min(count, _INT_BITS)
+        elif count < _INT_BITS:
+            value = lhs << count
+        else:
+            value = 0
+        return _wrap(value, unsigned), unsigned
+
+    # usual arithmetic conversions
+    unsigned = lhs[1] or rhs[1]
+    lhs, rhs = _wrap(lhs[0], unsigned), _wrap(rhs[0], unsigned)
+
+    if op == "*":
+        value = lhs * rhs
+    elif op == "+":
+        value = lhs + rhs
+    elif op == "-":
+        value = lhs - rhs
+    elif op in ("/", "%"):
+        if rhs == 0:
+            if skip:
+                return 0, False
+            raise _ExpressionError()
+        # the quotient is truncated towards zero
+        value = abs(lhs) // abs(rhs)
+        if (lhs < 0) != (rhs < 0):
+            value = -value
+        if op == "%":
+            value = lhs - value * rhs
+    elif op == "&":
+        value = lhs & rhs
+    elif op == "^":
+        value = lhs ^ rhs
+    elif op == "|":
+        value = lhs | rhs
+    else:
+        if op == "<":
+            value = lhs < rhs
+        elif op == "<=":
+            value = lhs <= rhs
+        elif op == ">":
+            value = lhs > rhs
+        elif op == ">=":
+            value = lhs >= rhs
+        elif op == "==":
+            value = lhs == rhs
+        else:
+            value = lhs != rhs
+        return 1 if value else 0, False
+
+    return _wrap(value, unsigned), unsigned
@@ -0,0 +1,168 @@
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# The protocol is as simple as possible to keep the client lightweight: the
+# client sends the working directory and the command line arguments separated
+# with the null characters and shuts down the writing side of the connection;
+# the server replies with a header line containing the exit code and the size
+# of the standard output, which is followed by the contents of the standard
+# output and error streams.
+
+import errno
+import os
+import socket
+
+from depgen import decode23, encode23
+
+try:
+    from StringIO import StringIO as StringIO23
+except ImportError:
+    from io import StringIO as StringIO23  # noqa: F401
+
+_BUF_SIZE = 65536
+
+
+def _recv_all(sock):
+    chunks = []
+    while 1:
+        chunk = sock.recv(_BUF_SIZE)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def serve_forever(socket_path, handler, workers=1):
+    """
+    Listens on the Unix domain socket SOCKET_PATH and calls
+    HANDLER(cwd, argv) for each request. The handler must return a tuple of
+    the exit code and the contents of the standard output and error streams.
+    The requests are served concurrently by WORKERS processes (the current one
+    and the ones forked after the socket is created), each of which calls its
+    own copy of the handler for one request at a time. The function returns
+    when the process receives SIGINT or SIGTERM.
+    """
+    import signal
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    if os.path.exists(socket_path):
+        # Do not steal the socket from a running server:
+        try:
+            sock.connect(socket_path)
+        except socket.error:
+            os.remove(socket_path)
+        else:
+            sock.close()
+            raise RuntimeError(
+                "socket '{0}' is already in use".format(socket_path)
+            )
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def terminate(*_):
+        # Handled the same way as SIGINT: in contrast to SystemExit, the
+        # exception is not intercepted by the handler of the current request:
+        raise KeyboardInterrupt()
+
+    signal.signal(signal.SIGTERM, terminate)
+
+    sock.bind(socket_path)
+    children = []
+    try:
+        sock.listen(socket.SOMAXCONN)
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                # The child process must not clean up after the parent one:
+                try:
+                    _serve(sock, handler)
+                except BaseException:
+                    import traceback
+
+                    traceback.print_exc()
+                    os._exit(1)
+                os._exit(0)
+            children.append(pid)
+        _serve(sock, handler)
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        sock.close()
+        os.remove(socket_path)
+
+
+def _serve(sock, handler):
+    # Accepts and handles the requests until SIGINT or SIGTERM is received:
+    try:
+        while 1:
+            conn, _ = sock.accept()
+            try:
+                fields = _recv_all(conn).split(b"\0")
+                exitcode, out, err = handler(
+                    decode23(fields[0]), [decode23(f) for f in fields[1:]]
+                )
+                out, err = encode23(out), encode23(err)
+                conn.sendall(
+                    "{0} {1}\n".format(exitcode, len(out)).encode("ascii")
+                )
+                conn.sendall(out)
+                conn.sendall(err)
+            except socket.error as e:
+                # The client has gone, serve the next one:
+                if e.errno != errno.EPIPE:
+                    raise
+            finally:
+                conn.close()
+    except KeyboardInterrupt:
+        pass
+
+
+def request(socket_path, argv):
+    """
+    Sends the command line arguments ARGV to the server listening on the Unix
+    domain socket SOCKET_PATH. Returns a tuple of the exit code and the
+    contents of the standard output and error streams (as bytes) or raises
+    socket.error if the server is not available.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+        sock.sendall(b"\0".join([encode23(a) for a in [os.getcwd()] + argv]))
+        sock.shutdown(socket.SHUT_WR)
+        reply = _recv_all(sock)
+    finally:
+        sock.close()
+
+    header, _, reply = reply.partition(b"\n")
+    exitcode, out_size = [int(f) for f in header.split()]
+    return exitcode, reply[:out_size], reply[out_size:]
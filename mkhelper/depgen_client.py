@@ -0,0 +1,83 @@
+#!/bin/sh
+
+# Copyright (c) 2018-2026, MPI-M
+#
+# Author: Sergey Kosukhin <sergey.kosukhin@mpimet.mpg.de>
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+""":"
+for cmd in python3 python; do
+  if command -v > /dev/null "${cmd}"; then
+    exec "${cmd}" "$0" "$@"
+  fi
+done
+echo "Error: could not find a python interpreter!" >&2
+exit 1
+":"""
+
+
+# A lightweight client of the depgen server (see `depgen.py --serve`). Usage:
+#   depgen_client.py SOCKET [DEPGEN_ARGS...]
+# If the server is not available, the program falls back to running
+# `depgen.py DEPGEN_ARGS...`.
+
+import os
+import sys
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.stderr.write(
+            "usage: {0} SOCKET [DEPGEN_ARGS...]\n".format(
+                os.path.basename(__file__)
+            )
+        )
+        sys.exit(2)
+
+    socket_path, argv = sys.argv[1], sys.argv[2:]
+
+    from depgen.server import request
+
+    try:
+        exitcode, out, err = request(socket_path, argv)
+    except (EnvironmentError, ValueError):
+        depgen = os.path.join(os.path.dirname(__file__), "depgen.py")
+        os.execv(sys.executable, [sys.executable, depgen] + argv)
+
+    if sys.version_info < (3, 0, 0):
+        stdout, stderr = sys.stdout, sys.stderr
+    else:
+        stdout, stderr = sys.stdout.buffer, sys.stderr.buffer
+
+    stdout.write(out)
+    stderr.write(err)
+    sys.exit(exitcode)
+
+
+if __name__ == "__main__":
+    main()
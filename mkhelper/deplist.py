@@ -243,6 +243,16 @@ def read_makefiles(makefiles, ignore_order_only, ignore_hints):
         elif not os.path.isfile(mkf):
             continue
         else:
+            rules = read_json_rules(mkf)
+            if rules is not None:
+                for targets, prereqs, hints in rules:
+                    targets = set(targets)
+                    for target in targets:
+                        dep_graph[target].extend(prereqs)
+                    if hints and not ignore_hints:
+                        for target in targets:
+                            extra_edges[target].extend(hints)
+                continue
             stream = open(mkf, "r")
 
         it = iter(stream)
@@ -282,6 +292,28 @@ def read_makefiles(makefiles, ignore_order_only, ignore_hints):
     return dep_graph, extra_edges
 
 
+def read_json_rules(makefile):
+    """
+    Returns the list of rules stored in MAKEFILE.json by `depgen.py --json`,
+    which is a faster alternative to parsing the MAKEFILE, or None if the file
+    does not exist or is older than the MAKEFILE.
+    """
+    json_file = makefile + ".json"
+    try:
+        if os.path.getmtime(json_file) < os.path.getmtime(makefile):
+            return None
+    except EnvironmentError:
+        return None
+
+    import json
+
+    try:
+        with open(json_file, "r") as f:
+            return json.load(f)["rules"]
+    except (EnvironmentError, ValueError, KeyError):
+        return None
+
+
 def visit_dfs(
     dep_graph,
     vertex,
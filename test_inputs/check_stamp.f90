@@ -0,0 +1,13 @@
+! args: --pp-enable --pp-eval-expr --fc-enable -i check_stamp.f90
+! expected output:
+! check_stamp.o: check_stamp.f90
+! check_stamp.o: keep2.mod
+! end of expected output
+
+! See check_stamp.mk for the check of the up-to-date dependency file.
+
+#ifdef USED
+use keep1
+#else
+use keep2
+#endif
@@ -0,0 +1,47 @@
+# Checks that a dependency file found up-to-date by depgen (with --check and
+# --check-macros) is left untouched together with the result of depmerge, and
+# that only its stamp is updated. Run from the directory of this file:
+#   make -f check_stamp.mk
+
+PYTHON= python
+DEPGEN= $(PYTHON) ../mkhelper/depgen.py
+DEPMERGE= $(PYTHON) ../mkhelper/depmerge.py
+DEPGEN_args= --pp-enable --pp-eval-expr --pp-macro-flag=-D --fc-enable --check --check-macros
+
+t= check_stamp.tmp
+
+# Fails unless the stamp is newer than $(t)/ref while the dependency file and
+# the result of depmerge are not:
+check_untouched= test -n "$$(find $(t) -newer $(t)/ref -name "*.d.stamp")" && test -z "$$(find $(t) -newer $(t)/ref \( -name "*.d" -o -name deps.mk \))"
+
+check:
+	rm -rf $(t) && mkdir $(t) && cp check_stamp.f90 $(t)/ && touch $(t)/flags
+	$(MAKE) -f check_stamp.mk $(t)/deps.mk FCFLAGS=-DUSED
+	sleep 1 && touch $(t)/ref && sleep 1
+# The source file is touched but not changed (the fingerprint check passes):
+	touch $(t)/check_stamp.f90
+	$(MAKE) -f check_stamp.mk $(t)/deps.mk FCFLAGS=-DUSED
+	$(check_untouched)
+# A macro that does not affect the source file is defined (the macro check
+# passes), $(t)/flags is touched as mkhelper.mk is when the flags change:
+	touch $(t)/flags
+	$(MAKE) -f check_stamp.mk $(t)/deps.mk FCFLAGS="-DUSED -DUNUSED"
+	$(check_untouched)
+# The macro that affects the source file is undefined (the file is regenerated):
+	touch $(t)/flags
+	$(MAKE) -f check_stamp.mk $(t)/deps.mk FCFLAGS=-DUNUSED
+	test -n "$$(find $(t) -newer $(t)/ref -name deps.mk)"
+	grep "keep2.mod" $(t)/deps.mk
+	rm -rf $(t)
+
+%.f90.d.stamp: %.f90 $(t)/flags
+	$(DEPGEN) $(DEPGEN_args) -o $(@:.stamp=) --obj-name $(@:.f90.d.stamp=.o) -i $< -- $(FCFLAGS)
+
+%.f90.d: %.f90.d.stamp
+	@test -f '$@' || { rm -f '$<'; $(MAKE) -f check_stamp.mk '$<'; }
+
+$(t)/deps.mk: $(t)/check_stamp.f90.d
+	$(DEPMERGE) -o $@ -i $^
+
+.PRECIOUS: $(t)/check_stamp.f90.d.stamp
+.PHONY: check
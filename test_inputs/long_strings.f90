@@ -0,0 +1,12 @@
+! args: --pp-enable --fc-enable -i long_strings.f90
+! expected output:
+! long_strings.o: long_strings.f90
+! long_strings.o: keep1.mod keep2.mod keep3.mod
+! end of expected output
+
+module long_strings
+  'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d' // 'a;b!c/*d'; use keep1 ! use drop1
+  x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; x = "y;z!/*"; use keep2
+  /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" /* c; ! */ "/* q */" ; use keep3
+  '\' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! \' ;! ; use drop2
+end module long_strings
@@ -0,0 +1,31 @@
+! args: --fc-enable --fc-root-smod yes -i module_prefixes.f90
+! expected output:
+! module_prefixes.o: module_prefixes.f90
+! module_prefixes.o: keep1.mod keep2.mod
+! extendable.smod subroutine_utils.smod: module_prefixes.o
+! end of expected output
+
+module subroutine_utils
+  use keep1
+  integer, parameter :: k = 8
+  attr0(kind=k0) attr1(kind=k1) attr2(kind=k2) attr3(kind=k3) attr4(kind=k4) attr5(kind=k5) attr6(kind=k6) attr7(kind=k7) attr8(kind=k8) attr9(kind=k9) attr10(kind=k10) attr11(kind=k11) attr12(kind=k12) attr13(kind=k13) attr14(kind=k14) attr15(kind=k15) attr16(kind=k16) attr17(kind=k17) attr18(kind=k18) attr19(kind=k19) attr20(kind=k20) attr21(kind=k21) attr22(kind=k22) attr23(kind=k23) attr24(kind=k24) attr25(kind=k25) attr26(kind=k26) attr27(kind=k27) attr28(kind=k28) attr29(kind=k29) attr30(kind=k30) attr31(kind=k31) attr32(kind=k32) attr33(kind=k33) attr34(kind=k34) attr35(kind=k35) attr36(kind=k36) attr37(kind=k37) attr38(kind=k38) attr39(kind=k39) attr40(kind=k40) attr41(kind=k41) attr42(kind=k42) attr43(kind=k43) attr44(kind=k44) attr45(kind=k45) attr46(kind=k46) attr47(kind=k47) attr48(kind=k48) attr49(kind=k49) attr50(kind=k50) attr51(kind=k51) attr52(kind=k52) attr53(kind=k53) attr54(kind=k54) attr55(kind=k55) attr56(kind=k56) attr57(kind=k57) attr58(kind=k58) attr59(kind=k59) attr60(kind=k60) attr61(kind=k61) attr62(kind=k62) attr63(kind=k63) attr64(kind=k64) attr65(kind=k65) attr66(kind=k66) attr67(kind=k67) attr68(kind=k68) attr69(kind=k69) attr70(kind=k70) attr71(kind=k71) attr72(kind=k72) attr73(kind=k73) attr74(kind=k74) attr75(kind=k75) attr76(kind=k76) attr77(kind=k77) attr78(kind=k78) attr79(kind=k79) attr80(kind=k80) attr81(kind=k81) attr82(kind=k82) attr83(kind=k83) attr84(kind=k84) attr85(kind=k85) attr86(kind=k86) attr87(kind=k87) attr88(kind=k88) attr89(kind=k89) attr90(kind=k90) attr91(kind=k91) attr92(kind=k92) attr93(kind=k93) attr94(kind=k94) attr95(kind=k95) attr96(kind=k96) attr97(kind=k97) attr98(kind=k98) attr99(kind=k99) attr100(kind=k100) attr101(kind=k101) attr102(kind=k102) attr103(kind=k103) attr104(kind=k104) attr105(kind=k105) attr106(kind=k106) attr107(kind=k107) attr108(kind=k108) attr109(kind=k109) attr110(kind=k110) attr111(kind=k111) attr112(kind=k112) attr113(kind=k113) attr114(kind=k114) attr115(kind=k115) attr116(kind=k116) attr117(kind=k117) attr118(kind=k118) attr119(kind=k119) attr120(kind=k120) attr121(kind=k121) attr122(kind=k122) attr123(kind=k123) attr124(kind=k124) attr125(kind=k125) attr126(kind=k126) attr127(kind=k127) attr128(kind=k128) attr129(kind=k129) attr130(kind=k130) attr131(kind=k131) attr132(kind=k132) attr133(kind=k133) attr134(kind=k134) attr135(kind=k135) attr136(kind=k136) attr137(kind=k137) attr138(kind=k138) attr139(kind=k139) attr140(kind=k140) attr141(kind=k141) attr142(kind=k142) attr143(kind=k143) attr144(kind=k144) attr145(kind=k145) attr146(kind=k146) attr147(kind=k147) attr148(kind=k148) attr149(kind=k149) attr150(kind=k150) attr151(kind=k151) attr152(kind=k152) attr153(kind=k153) attr154(kind=k154) attr155(kind=k155) attr156(kind=k156) attr157(kind=k157) attr158(kind=k158) attr159(kind=k159) attr160(kind=k160) attr161(kind=k161) attr162(kind=k162) attr163(kind=k163) attr164(kind=k164) attr165(kind=k165) attr166(kind=k166) attr167(kind=k167) attr168(kind=k168) attr169(kind=k169) attr170(kind=k170) attr171(kind=k171) attr172(kind=k172) attr173(kind=k173) attr174(kind=k174) attr175(kind=k175) attr176(kind=k176) attr177(kind=k177) attr178(kind=k178) attr179(kind=k179) attr180(kind=k180) attr181(kind=k181) attr182(kind=k182) attr183(kind=k183) attr184(kind=k184) attr185(kind=k185) attr186(kind=k186) attr187(kind=k187) attr188(kind=k188) attr189(kind=k189) attr190(kind=k190) attr191(kind=k191) attr192(kind=k192) attr193(kind=k193) attr194(kind=k194) attr195(kind=k195) attr196(kind=k196) attr197(kind=k197) attr198(kind=k198) attr199(kind=k199) attr200(kind=k200) attr201(kind=k201) attr202(kind=k202) attr203(kind=k203) attr204(kind=k204) attr205(kind=k205) attr206(kind=k206) attr207(kind=k207) attr208(kind=k208) attr209(kind=k209) attr210(kind=k210) attr211(kind=k211) attr212(kind=k212) attr213(kind=k213) attr214(kind=k214) attr215(kind=k215) attr216(kind=k216) attr217(kind=k217) attr218(kind=k218) attr219(kind=k219) attr220(kind=k220) attr221(kind=k221) attr222(kind=k222) attr223(kind=k223) attr224(kind=k224) attr225(kind=k225) attr226(kind=k226) attr227(kind=k227) attr228(kind=k228) attr229(kind=k229) attr230(kind=k230) attr231(kind=k231) attr232(kind=k232) attr233(kind=k233) attr234(kind=k234) attr235(kind=k235) attr236(kind=k236) attr237(kind=k237) attr238(kind=k238) attr239(kind=k239) attr240(kind=k240) attr241(kind=k241) attr242(kind=k242) attr243(kind=k243) attr244(kind=k244) attr245(kind=k245) attr246(kind=k246) attr247(kind=k247) attr248(kind=k248) attr249(kind=k249) attr250(kind=k250) attr251(kind=k251) attr252(kind=k252) attr253(kind=k253) attr254(kind=k254) attr255(kind=k255) attr256(kind=k256) attr257(kind=k257) attr258(kind=k258) attr259(kind=k259) attr260(kind=k260) attr261(kind=k261) attr262(kind=k262) attr263(kind=k263) attr264(kind=k264) attr265(kind=k265) attr266(kind=k266) attr267(kind=k267) attr268(kind=k268) attr269(kind=k269) attr270(kind=k270) attr271(kind=k271) attr272(kind=k272) attr273(kind=k273) attr274(kind=k274) attr275(kind=k275) attr276(kind=k276) attr277(kind=k277) attr278(kind=k278) attr279(kind=k279) attr280(kind=k280) attr281(kind=k281) attr282(kind=k282) attr283(kind=k283) attr284(kind=k284) attr285(kind=k285) attr286(kind=k286) attr287(kind=k287) attr288(kind=k288) attr289(kind=k289) attr290(kind=k290) attr291(kind=k291) attr292(kind=k292) attr293(kind=k293) attr294(kind=k294) attr295(kind=k295) attr296(kind=k296) attr297(kind=k297) attr298(kind=k298) attr299(kind=k299) module attr0(kind=k0) attr1(kind=k1) attr2(kind=k2) attr3(kind=k3) attr4(kind=k4) attr5(kind=k5) attr6(kind=k6) attr7(kind=k7) attr8(kind=k8) attr9(kind=k9) attr10(kind=k10) attr11(kind=k11) attr12(kind=k12) attr13(kind=k13) attr14(kind=k14) attr15(kind=k15) attr16(kind=k16) attr17(kind=k17) attr18(kind=k18) attr19(kind=k19) attr20(kind=k20) attr21(kind=k21) attr22(kind=k22) attr23(kind=k23) attr24(kind=k24) attr25(kind=k25) attr26(kind=k26) attr27(kind=k27) attr28(kind=k28) attr29(kind=k29) attr30(kind=k30) attr31(kind=k31) attr32(kind=k32) attr33(kind=k33) attr34(kind=k34) attr35(kind=k35) attr36(kind=k36) attr37(kind=k37) attr38(kind=k38) attr39(kind=k39) attr40(kind=k40) attr41(kind=k41) attr42(kind=k42) attr43(kind=k43) attr44(kind=k44) attr45(kind=k45) attr46(kind=k46) attr47(kind=k47) attr48(kind=k48) attr49(kind=k49) attr50(kind=k50) attr51(kind=k51) attr52(kind=k52) attr53(kind=k53) attr54(kind=k54) attr55(kind=k55) attr56(kind=k56) attr57(kind=k57) attr58(kind=k58) attr59(kind=k59) attr60(kind=k60) attr61(kind=k61) attr62(kind=k62) attr63(kind=k63) attr64(kind=k64) attr65(kind=k65) attr66(kind=k66) attr67(kind=k67) attr68(kind=k68) attr69(kind=k69) attr70(kind=k70) attr71(kind=k71) attr72(kind=k72) attr73(kind=k73) attr74(kind=k74) attr75(kind=k75) attr76(kind=k76) attr77(kind=k77) attr78(kind=k78) attr79(kind=k79) attr80(kind=k80) attr81(kind=k81) attr82(kind=k82) attr83(kind=k83) attr84(kind=k84) attr85(kind=k85) attr86(kind=k86) attr87(kind=k87) attr88(kind=k88) attr89(kind=k89) attr90(kind=k90) attr91(kind=k91) attr92(kind=k92) attr93(kind=k93) attr94(kind=k94) attr95(kind=k95) attr96(kind=k96) attr97(kind=k97) attr98(kind=k98) attr99(kind=k99) attr100(kind=k100) attr101(kind=k101) attr102(kind=k102) attr103(kind=k103) attr104(kind=k104) attr105(kind=k105) attr106(kind=k106) attr107(kind=k107) attr108(kind=k108) attr109(kind=k109) attr110(kind=k110) attr111(kind=k111) attr112(kind=k112) attr113(kind=k113) attr114(kind=k114) attr115(kind=k115) attr116(kind=k116) attr117(kind=k117) attr118(kind=k118) attr119(kind=k119) attr120(kind=k120) attr121(kind=k121) attr122(kind=k122) attr123(kind=k123) attr124(kind=k124) attr125(kind=k125) attr126(kind=k126) attr127(kind=k127) attr128(kind=k128) attr129(kind=k129) attr130(kind=k130) attr131(kind=k131) attr132(kind=k132) attr133(kind=k133) attr134(kind=k134) attr135(kind=k135) attr136(kind=k136) attr137(kind=k137) attr138(kind=k138) attr139(kind=k139) attr140(kind=k140) attr141(kind=k141) attr142(kind=k142) attr143(kind=k143) attr144(kind=k144) attr145(kind=k145) attr146(kind=k146) attr147(kind=k147) attr148(kind=k148) attr149(kind=k149) attr150(kind=k150) attr151(kind=k151) attr152(kind=k152) attr153(kind=k153) attr154(kind=k154) attr155(kind=k155) attr156(kind=k156) attr157(kind=k157) attr158(kind=k158) attr159(kind=k159) attr160(kind=k160) attr161(kind=k161) attr162(kind=k162) attr163(kind=k163) attr164(kind=k164) attr165(kind=k165) attr166(kind=k166) attr167(kind=k167) attr168(kind=k168) attr169(kind=k169) attr170(kind=k170) attr171(kind=k171) attr172(kind=k172) attr173(kind=k173) attr174(kind=k174) attr175(kind=k175) attr176(kind=k176) attr177(kind=k177) attr178(kind=k178) attr179(kind=k179) attr180(kind=k180) attr181(kind=k181) attr182(kind=k182) attr183(kind=k183) attr184(kind=k184) attr185(kind=k185) attr186(kind=k186) attr187(kind=k187) attr188(kind=k188) attr189(kind=k189) attr190(kind=k190) attr191(kind=k191) attr192(kind=k192) attr193(kind=k193) attr194(kind=k194) attr195(kind=k195) attr196(kind=k196) attr197(kind=k197) attr198(kind=k198) attr199(kind=k199) attr200(kind=k200) attr201(kind=k201) attr202(kind=k202) attr203(kind=k203) attr204(kind=k204) attr205(kind=k205) attr206(kind=k206) attr207(kind=k207) attr208(kind=k208) attr209(kind=k209) attr210(kind=k210) attr211(kind=k211) attr212(kind=k212) attr213(kind=k213) attr214(kind=k214) attr215(kind=k215) attr216(kind=k216) attr217(kind=k217) attr218(kind=k218) attr219(kind=k219) attr220(kind=k220) attr221(kind=k221) attr222(kind=k222) attr223(kind=k223) attr224(kind=k224) attr225(kind=k225) attr226(kind=k226) attr227(kind=k227) attr228(kind=k228) attr229(kind=k229) attr230(kind=k230) attr231(kind=k231) attr232(kind=k232) attr233(kind=k233) attr234(kind=k234) attr235(kind=k235) attr236(kind=k236) attr237(kind=k237) attr238(kind=k238) attr239(kind=k239) attr240(kind=k240) attr241(kind=k241) attr242(kind=k242) attr243(kind=k243) attr244(kind=k244) attr245(kind=k245) attr246(kind=k246) attr247(kind=k247) attr248(kind=k248) attr249(kind=k249) attr250(kind=k250) attr251(kind=k251) attr252(kind=k252) attr253(kind=k253) attr254(kind=k254) attr255(kind=k255) attr256(kind=k256) attr257(kind=k257) attr258(kind=k258) attr259(kind=k259) attr260(kind=k260) attr261(kind=k261) attr262(kind=k262) attr263(kind=k263) attr264(kind=k264) attr265(kind=k265) attr266(kind=k266) attr267(kind=k267) attr268(kind=k268) attr269(kind=k269) attr270(kind=k270) attr271(kind=k271) attr272(kind=k272) attr273(kind=k273) attr274(kind=k274) attr275(kind=k275) attr276(kind=k276) attr277(kind=k277) attr278(kind=k278) attr279(kind=k279) attr280(kind=k280) attr281(kind=k281) attr282(kind=k282) attr283(kind=k283) attr284(kind=k284) attr285(kind=k285) attr286(kind=k286) attr287(kind=k287) attr288(kind=k288) attr289(kind=k289) attr290(kind=k290) attr291(kind=k291) attr292(kind=k292) attr293(kind=k293) attr294(kind=k294) attr295(kind=k295) attr296(kind=k296) attr297(kind=k297) attr298(kind=k298) attr299(kind=k299) integer
+  w0 w1 w2 w3 w4 w5 w6 w7 w8 w9 w10 w11 w12 w13 w14 w15 w16 w17 w18 w19 w20 w21 w22 w23 w24 w25 w26 w27 w28 w29 w30 w31 w32 w33 w34 w35 w36 w37 w38 w39 w40 w41 w42 w43 w44 w45 w46 w47 w48 w49 w50 w51 w52 w53 w54 w55 w56 w57 w58 w59 w60 w61 w62 w63 w64 w65 w66 w67 w68 w69 w70 w71 w72 w73 w74 w75 w76 w77 w78 w79 w80 w81 w82 w83 w84 w85 w86 w87 w88 w89 w90 w91 w92 w93 w94 w95 w96 w97 w98 w99 w100 w101 w102 w103 w104 w105 w106 w107 w108 w109 w110 w111 w112 w113 w114 w115 w116 w117 w118 w119 w120 w121 w122 w123 w124 w125 w126 w127 w128 w129 w130 w131 w132 w133 w134 w135 w136 w137 w138 w139 w140 w141 w142 w143 w144 w145 w146 w147 w148 w149 w150 w151 w152 w153 w154 w155 w156 w157 w158 w159 w160 w161 w162 w163 w164 w165 w166 w167 w168 w169 w170 w171 w172 w173 w174 w175 w176 w177 w178 w179 w180 w181 w182 w183 w184 w185 w186 w187 w188 w189 w190 w191 w192 w193 w194 w195 w196 w197 w198 w199 w200 w201 w202 w203 w204 w205 w206 w207 w208 w209 w210 w211 w212 w213 w214 w215 w216 w217 w218 w219 w220 w221 w222 w223 w224 w225 w226 w227 w228 w229 w230 w231 w232 w233 w234 w235 w236 w237 w238 w239 w240 w241 w242 w243 w244 w245 w246 w247 w248 w249 w250 w251 w252 w253 w254 w255 w256 w257 w258 w259 w260 w261 w262 w263 w264 w265 w266 w267 w268 w269 w270 w271 w272 w273 w274 w275 w276 w277 w278 w279 w280 w281 w282 w283 w284 w285 w286 w287 w288 w289 w290 w291 w292 w293 w294 w295 w296 w297 w298 w299 module w0 w1 w2 w3 w4 w5 w6 w7 w8 w9 w10 w11 w12 w13 w14 w15 w16 w17 w18 w19 w20 w21 w22 w23 w24 w25 w26 w27 w28 w29 w30 w31 w32 w33 w34 w35 w36 w37 w38 w39 w40 w41 w42 w43 w44 w45 w46 w47 w48 w49 w50 w51 w52 w53 w54 w55 w56 w57 w58 w59 w60 w61 w62 w63 w64 w65 w66 w67 w68 w69 w70 w71 w72 w73 w74 w75 w76 w77 w78 w79 w80 w81 w82 w83 w84 w85 w86 w87 w88 w89 w90 w91 w92 w93 w94 w95 w96 w97 w98 w99 w100 w101 w102 w103 w104 w105 w106 w107 w108 w109 w110 w111 w112 w113 w114 w115 w116 w117 w118 w119 w120 w121 w122 w123 w124 w125 w126 w127 w128 w129 w130 w131 w132 w133 w134 w135 w136 w137 w138 w139 w140 w141 w142 w143 w144 w145 w146 w147 w148 w149 w150 w151 w152 w153 w154 w155 w156 w157 w158 w159 w160 w161 w162 w163 w164 w165 w166 w167 w168 w169 w170 w171 w172 w173 w174 w175 w176 w177 w178 w179 w180 w181 w182 w183 w184 w185 w186 w187 w188 w189 w190 w191 w192 w193 w194 w195 w196 w197 w198 w199 w200 w201 w202 w203 w204 w205 w206 w207 w208 w209 w210 w211 w212 w213 w214 w215 w216 w217 w218 w219 w220 w221 w222 w223 w224 w225 w226 w227 w228 w229 w230 w231 w232 w233 w234 w235 w236 w237 w238 w239 w240 w241 w242 w243 w244 w245 w246 w247 w248 w249 w250 w251 w252 w253 w254 w255 w256 w257 w258 w259 w260 w261 w262 w263 w264 w265 w266 w267 w268 w269 w270 w271 w272 w273 w274 w275 w276 w277 w278 w279 w280 w281 w282 w283 w284 w285 w286 w287 w288 w289 w290 w291 w292 w293 w294 w295 w296 w297 w298 w299 x
+  real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real(real()))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))))) module function f()
+end module subroutine_utils
+
+module extendable
+  interface
+    pure elemental module function f(x)
+      real, intent(in) :: x
+      real :: f
+    end function f
+  end interface
+end module extendable
+
+module not_extendable
+  use keep2
+  interface
+    integer function module_f()
+    end function module_f
+  end interface
+end module not_extendable
@@ -0,0 +1,59 @@
+! args: --pp-enable --pp-eval-expr --fc-enable -i pp_if_macros.f90
+! expected output:
+! pp_if_macros.o: pp_if_macros.f90
+! pp_if_macros.o: keep1.mod keep10.mod keep2.mod keep3.mod keep4.mod keep5.mod keep6.mod keep7.mod keep8.mod keep9.mod
+! end of expected output
+
+#define VERSION(major, minor) ((major) * 100 + (minor))
+#define CURRENT_VERSION VERSION(4, 9)
+#define MAX(a, b) ((a) > (b) ? (a) : (b))
+#define CAT(a, b) a ## b
+#define LEVEL1 7
+
+#if CURRENT_VERSION >= VERSION(4, 8)
+use keep1
+#else
+use ignore1
+#endif
+
+#if MAX(CURRENT_VERSION, 500) != 500
+use ignore2
+#else
+use keep2
+#endif
+
+#if CAT(LEVEL, 1) == 7 && !defined(UNDEFINED_MACRO)
+use keep3
+#endif
+
+#if 0 && MAX(1 / 0, 1)
+use ignore3
+#elif -1 < 0u
+use ignore4
+#else
+use keep4
+#endif
+
+#if 7 / -2 == -3 && -7 % 2 == -1
+use keep5
+#endif
+
+! The type char is signed:
+#if '\377' == 255
+use ignore5
+#elif '\377' == -1 && '\x80' < 0 && '\177' == 127
+use keep10
+#endif
+
+! Malformed character constants fail the evaluation (both branches are kept):
+#if 'x' == '\xZ'
+use keep6
+#else
+use keep7
+#endif
+
+#if '\x' || '\08'
+use keep8
+#else
+use keep9
+#endif